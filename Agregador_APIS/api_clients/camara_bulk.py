@@ -0,0 +1,141 @@
+# camara_bulk.py - Carga em massa dos deputados de uma legislatura
+
+# Monta o perfil completo de cada deputado (detalhes, órgãos, ocupações e despesas)
+# com concorrência limitada. Todas as threads dividem o mesmo limite de requisições
+# do camara_client. O resultado é um JSONL com uma linha por deputado; se a carga
+# for interrompida, a próxima execução pula os deputados que já estão no arquivo.
+#
+# Uso: python camara_bulk.py 57 [--saida deputados_57.jsonl] [--workers 8] [--parquet]
+
+import argparse
+import json
+import os
+from concurrent.futures import as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+import camara_client
+
+MAX_WORKERS = 8
+MAX_PAGES_LISTAS = 20
+MAX_PAGES_DESPESAS = 100
+
+
+def _ids_concluidos(caminho: str) -> Set[int]:
+    """
+    Ids já gravados no JSONL. Uma linha final incompleta (carga interrompida no
+    meio da escrita) é removida do arquivo para que a retomada não a corrompa.
+    """
+    ids: Set[int] = set()
+    if not os.path.exists(caminho):
+        return ids
+    with open(caminho, "rb+") as f:
+        completo = 0
+        for linha in f:
+            if not linha.endswith(b"\n"):
+                break
+            completo += len(linha)
+            try:
+                ids.add(json.loads(linha)["id"])
+            except (ValueError, KeyError):
+                continue
+        f.truncate(completo)
+    return ids
+
+
+def perfil_deputado(id_deputado: int, id_legislatura: int) -> Dict[str, Any]:
+    """Reúne detalhes, órgãos, ocupações e despesas da legislatura de um deputado."""
+    return {
+        "id": id_deputado,
+        "idLegislatura": id_legislatura,
+        "coletadoEm": datetime.now().isoformat(timespec="seconds"),
+        "deputado": camara_client.obter_deputado(id_deputado),
+        "orgaos": list(camara_client.iter_orgaos_deputado(id_deputado, max_pages=MAX_PAGES_LISTAS)),
+        "ocupacoes": list(camara_client.iter_ocupacoes_deputado(id_deputado, max_pages=MAX_PAGES_LISTAS)),
+        "despesas": list(camara_client.iter_despesas_deputado(
+            id_deputado, {"idLegislatura": id_legislatura}, max_pages=MAX_PAGES_DESPESAS
+        )),
+    }
+
+
+def hidratar_legislatura(
+    id_legislatura: int,
+    saida: Optional[str] = None,
+    max_workers: int = MAX_WORKERS,
+) -> str:
+    """
+    Gera (ou completa) o JSONL com o perfil de todos os deputados da legislatura.
+    Retorna o caminho do arquivo.
+    """
+    saida = saida or f"deputados_{id_legislatura}.jsonl"
+    concluidos = _ids_concluidos(saida)
+
+    with camara_client.prioridade(camara_client.LOTE):
+        deputados = camara_client.iter_deputados_legislatura(id_legislatura, max_pages=MAX_PAGES_LISTAS)
+        pendentes: List[int] = list(dict.fromkeys(d["id"] for d in deputados if d["id"] not in concluidos))
+    print(f"👥 Legislatura {id_legislatura}: {len(concluidos)} já coletados, {len(pendentes)} pendentes")
+
+    falhas = 0
+    # Carga em lote: cede a vez às consultas interativas no rate limit compartilhado
+    executor = camara_client.criar_executor(max_workers, camara_client.LOTE)
+    try:
+        with open(saida, "a", encoding="utf-8") as arquivo:
+            futuros = {executor.submit(perfil_deputado, id_dep, id_legislatura): id_dep for id_dep in pendentes}
+            for i, futuro in enumerate(as_completed(futuros), 1):
+                id_dep = futuros[futuro]
+                try:
+                    perfil = futuro.result()
+                except camara_client.CamaraAPIError as e:
+                    falhas += 1
+                    print(f"   ⚠️ Deputado {id_dep}: {e}")
+                    continue
+                # Uma linha completa por deputado: o arquivo é sempre retomável
+                arquivo.write(json.dumps(perfil, ensure_ascii=False) + "\n")
+                arquivo.flush()
+                if i % 50 == 0:
+                    print(f"   📊 {i}/{len(pendentes)} deputados processados")
+    finally:
+        # Em caso de interrupção, não espera os deputados que ainda estão na fila
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    print(f"✅ Carga concluída em {saida}" + (f" ({falhas} falhas, execute novamente para retomar)" if falhas else ""))
+    return saida
+
+
+def exportar_parquet(jsonl: str, parquet: Optional[str] = None) -> str:
+    """
+    Converte o JSONL em Parquet: campos do deputado viram colunas e as listas
+    aninhadas (órgãos, ocupações, despesas) são guardadas como texto JSON.
+    Requer pandas com pyarrow.
+    """
+    import pandas as pd
+
+    parquet = parquet or os.path.splitext(jsonl)[0] + ".parquet"
+    linhas = []
+    with open(jsonl, encoding="utf-8") as f:
+        for linha in f:
+            perfil = json.loads(linha)
+            registro = {"id": perfil["id"], "idLegislatura": perfil["idLegislatura"], "coletadoEm": perfil["coletadoEm"]}
+            registro.update(pd.json_normalize(perfil["deputado"], sep="_").iloc[0].to_dict())
+            registro["id"] = perfil["id"]
+            for campo in ("orgaos", "ocupacoes", "despesas"):
+                registro[campo] = json.dumps(perfil[campo], ensure_ascii=False)
+            linhas.append(registro)
+    pd.DataFrame(linhas).to_parquet(parquet, index=False)
+    return parquet
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Carga em massa dos deputados de uma legislatura")
+    parser.add_argument("legislatura", type=int, help="id da legislatura (ex.: 57)")
+    parser.add_argument("--saida", help="arquivo JSONL de saída")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--parquet", action="store_true", help="também exporta em Parquet")
+    args = parser.parse_args()
+
+    try:
+        arquivo = hidratar_legislatura(args.legislatura, saida=args.saida, max_workers=args.workers)
+        if args.parquet:
+            print(f"📦 Parquet gerado em {exportar_parquet(arquivo)}")
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Carga interrompida. Execute novamente para retomar de onde parou.")
@@ -3,62 +3,214 @@
 # Cliente dos Dados Abertos da Câmara dos Deputados com todos os endpoints implementados
 # Inclui headers, rate limiting e timeout ajustados, com lógica especial para votações.
 
+import re
 import requests
+import threading
 import time
 from time import sleep
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Iterator, Tuple, Sequence, Callable
+from contextlib import contextmanager
+from datetime import datetime, timedelta, date
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from disk_cache import DiskCache
+from json_codec import decode_response
+from rate_limiter import TokenBucket
+from single_flight import SingleFlight, request_key
 
 BASE_URL = "https://dadosabertos.camara.leg.br/api/v2"
 
-# Headers que simulam um navegador comum para melhor compatibilidade
+# Headers que simulam um navegador comum para melhor compatibilidade.
+# Accept-Encoding anuncia apenas o que o urllib3 instalado sabe decodificar
+# (gzip/deflate sempre; br e zstd só se brotli/zstandard estiverem instalados).
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
     "Accept": "application/json",
-    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
     "Connection": "keep-alive"
 }
 
 # Timeout mais generoso: (tempo para conectar, tempo para ler a resposta)
 TIMEOUT = (15, 45)
 
+# Paginação paralela: usa o link `last` da primeira página para descobrir o total
+# de páginas e busca as restantes em paralelo (desligado por padrão)
+PARALLEL_PAGES = False
+MAX_WORKERS = 4
+
+# Tamanhos de página (`itens`) tentados pelo paginador, do maior para o menor.
+# Cada valor divide o anterior, para que a troca no meio de uma paginação
+# preserve a posição (pagina/itens). Um 504 que se repete ITENS_TENTATIVAS_504
+# vezes no mesmo tamanho, ou uma resposta mais lenta que SLOW_RESPONSE_SECONDS,
+# reduz o tamanho usado para o endpoint. A redução vale por ITENS_RECUPERACAO_SECONDS;
+# depois disso o endpoint volta a subir um tamanho por período.
+ITENS_ESCALA = (100, 50, 25, 5)
+SLOW_RESPONSE_SECONDS = 15.0
+ITENS_TENTATIVAS_504 = 2
+ITENS_RECUPERACAO_SECONDS = 600.0
+
+# Maior quantidade de ids aceita por requisição nas consultas em lote (`id=` repetido)
+ID_BATCH_SIZE = 100
+
+# Orçamento de requisições da Câmara (mesmo de API_CONFIG["camara_deputados"]):
+# 120 requisições por minuto com burst de 30, compartilhado por todas as threads
+RATE_LIMIT_PER_MINUTE = 120
+RATE_LIMIT_BURST = 30
+
+# Espera base entre tentativas (cresce exponencialmente a cada nova tentativa)
+RETRY_BACKOFF = 1.0
+
+# Classes de prioridade das requisições. Consultas interativas passam à frente da
+# fila do rate limit; cargas em lote (crawlers, sincronizações) usam o que sobra e
+# nunca consomem os RATE_LIMIT_RESERVA_INTERATIVA tokens guardados para as interativas.
+INTERATIVA = 0
+LOTE = 1
+RATE_LIMIT_RESERVA_INTERATIVA = 5
+
+_rate_limiter = TokenBucket.per_minute(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST, RATE_LIMIT_RESERVA_INTERATIVA)
+_prioridade = threading.local()
+
+# Sessão com pool de conexões keep-alive: evita um handshake TCP+TLS por requisição.
+# O pool deve comportar ao menos MAX_WORKERS conexões simultâneas. Há um pool por
+# host: a API (dadosabertos) e os arquivos de inteiro teor (www.camara.leg.br).
+POOL_HOSTS = 2
+POOL_SIZE = 10
+
+_session = requests.Session()
+_session.headers.update(HEADERS)
+
+def configurar_pool(tamanho: int = POOL_SIZE) -> None:
+    """Define o tamanho do pool de conexões da sessão da Câmara."""
+    adapter = requests.adapters.HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=tamanho)
+    _session.mount("https://", adapter)
+    _session.mount("http://", adapter)
+
+configurar_pool()
+
+def configurar_rate_limit(
+    requests_per_minute: int = RATE_LIMIT_PER_MINUTE,
+    burst: int = RATE_LIMIT_BURST,
+    reserva_interativa: int = RATE_LIMIT_RESERVA_INTERATIVA
+) -> None:
+    """Ajusta o limite de requisições compartilhado por todas as chamadas à Câmara."""
+    _rate_limiter.configure(requests_per_minute / 60.0, burst, reserva_interativa)
+
+def prioridade_atual() -> int:
+    """Classe de prioridade das requisições feitas pela thread atual (padrão: INTERATIVA)."""
+    return getattr(_prioridade, "valor", INTERATIVA)
+
+def definir_prioridade(classe: int) -> None:
+    _prioridade.valor = classe
+
+@contextmanager
+def prioridade(classe: int) -> Iterator[None]:
+    """
+    Executa o bloco com outra classe de prioridade. Ex.:
+
+    with camara_client.prioridade(camara_client.LOTE):
+        crawler()
+    """
+    anterior = prioridade_atual()
+    definir_prioridade(classe)
+    try:
+        yield
+    finally:
+        definir_prioridade(anterior)
+
+def criar_executor(max_workers: int, classe: Optional[int] = None) -> ThreadPoolExecutor:
+    """
+    ThreadPoolExecutor cujas threads fazem requisições na classe `classe`
+    (padrão: a da thread que cria o executor).
+    """
+    classe = prioridade_atual() if classe is None else classe
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=definir_prioridade, initargs=(classe,))
+
 class CamaraAPIError(Exception):
     """Exceção personalizada para erros da API da Câmara."""
     pass
 
-def _get(url: str, params: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> Dict[str, Any]:
-    """Função auxiliar para GET com rate limiting e lógica de repetição (retry)."""
-    
+class CamaraGatewayTimeoutError(CamaraAPIError):
+    """Exceção para respostas 504 (consulta pesada demais para o servidor)."""
+    pass
+
+class PaginacaoIncompletaError(CamaraAPIError):
+    """Exceção para paginações interrompidas pelo limite de páginas (ainda havia link `next`)."""
+    pass
+
+def _retry_after(response: requests.Response, default: int = 30) -> int:
+    """Lê o cabeçalho Retry-After (em segundos), com valor padrão se ausente ou inválido."""
+    value = response.headers.get('retry-after', '')
+    return int(value) if value.strip().isdigit() else default
+
+# Requisições idênticas simultâneas (mesma URL + parâmetros) viram uma só
+_single_flight = SingleFlight()
+
+# Tempo de resposta do servidor na última requisição feita pela thread
+# (sem contar a espera no token bucket), usado pelo ajuste de `itens`
+_ultima_resposta = threading.local()
+
+def _get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_retries: int = 3,
+    retry_gateway_timeout: bool = True
+) -> Dict[str, Any]:
+    """
+    Função auxiliar para GET com rate limiting (token bucket) e lógica de repetição (retry).
+    Com `retry_gateway_timeout=False`, um 504 levanta CamaraGatewayTimeoutError
+    imediatamente, para que o chamador possa reduzir a consulta.
+
+    Chamadas simultâneas para o mesmo recurso compartilham uma única requisição
+    e o mesmo JSON decodificado (que não deve ser modificado pelo chamador).
+    Só chamadas da mesma classe de prioridade são unidas: uma consulta interativa
+    não espera na fila do rate limit atrás de uma requisição em lote.
+    """
+    return _single_flight.do(
+        request_key(url, params, retry_gateway_timeout, prioridade_atual()),
+        lambda: _get_uncoalesced(url, params, max_retries, retry_gateway_timeout)
+    )
+
+def _get_uncoalesced(
+    url: str,
+    params: Optional[Dict[str, Any]],
+    max_retries: int,
+    retry_gateway_timeout: bool
+) -> Dict[str, Any]:
     for attempt in range(max_retries):
         try:
-            # Pausa preventina entre tentativas para não sobrecarregar a API
+            # Backoff exponencial curto entre tentativas; o ritmo normal é dado pelo token bucket
             if attempt > 0:
-                sleep(5)
+                sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
             
-            response = requests.get(
+            _rate_limiter.acquire(priority=prioridade_atual())
+            response = _session.get(
                 url, 
-                headers=HEADERS, 
                 params=params, 
                 timeout=TIMEOUT
             )
             
             # Código 429: Too Many Requests (limite de requisições atingido)
             if response.status_code == 429:
-                retry_after = int(response.headers.get('retry-after', 30))
-                print(f"⏳ Rate limit atingido. Aguardando {retry_after}s...")
-                sleep(retry_after)
+                retry_after = _retry_after(response)
+                print(f"⏳ Rate limit atingido. Pausando todas as requisições por {retry_after}s...")
+                # Drena o bucket: todas as threads aguardam o Retry-After
+                _rate_limiter.drain(retry_after)
                 continue
             
             # Código 504: Gateway Timeout (servidor demorou demais para responder)
             if response.status_code == 504:
+                if not retry_gateway_timeout:
+                    raise CamaraGatewayTimeoutError(f"Gateway timeout em {url}")
                 if attempt == max_retries - 1:
-                    raise CamaraAPIError(f"Gateway timeout persistente após {max_retries} tentativas em {url}")
-                print(f"⏳ Gateway timeout na tentativa {attempt + 1}/{max_retries}, aguardando 10s...")
-                sleep(10)
+                    raise CamaraGatewayTimeoutError(f"Gateway timeout persistente após {max_retries} tentativas em {url}")
+                print(f"⏳ Gateway timeout na tentativa {attempt + 1}/{max_retries}, tentando novamente...")
                 continue
                 
             response.raise_for_status()
-            return response.json()
+            _ultima_resposta.elapsed = response.elapsed.total_seconds()
+            return decode_response(response)
             
         except requests.Timeout:
             if attempt == max_retries - 1:
@@ -79,28 +231,432 @@ def _get(url: str, params: Optional[Dict[str, Any]] = None, max_retries: int = 3
     
     raise CamaraAPIError(f"Falha irrecuperável após {max_retries} tentativas em {url}")
 
-def _get_limited_pages(endpoint: str, params: Optional[Dict[str, Any]] = None, max_pages: int = 3) -> List[Dict[str, Any]]:
-    """Percorre um número limitado de páginas de um resultado."""
-    results = []
-    url = f"{BASE_URL}/{endpoint}"
-    page_count = 0
+def _link(data: Dict[str, Any], rel: str) -> Optional[str]:
+    """Retorna o href do link `rel` (next, last, ...) de uma resposta paginada."""
+    return next((l["href"] for l in data.get("links", []) if l.get("rel") == rel), None)
+
+def _page_number(href: str) -> Optional[int]:
+    """Extrai o parâmetro `pagina` de um link de paginação."""
+    pagina = dict(parse_qsl(urlsplit(href).query)).get("pagina")
+    return int(pagina) if pagina and pagina.isdigit() else None
+
+def _page_url(href: str, pagina: int) -> str:
+    """Reescreve um link de paginação apontando para a página informada."""
+    parts = urlsplit(href)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "pagina"]
+    query.append(("pagina", str(pagina)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+# `itens` reduzido por endpoint (ids trocados por {id}) e o instante (monotonic) da redução
+_itens_por_endpoint: Dict[str, Tuple[int, float]] = {}
+_itens_lock = threading.Lock()
+
+def _endpoint_key(endpoint: str) -> str:
+    """Normaliza o endpoint para o ajuste de `itens` (ex.: deputados/{id}/despesas)."""
+    return re.sub(r"/[^/]*\d[^/]*(?=/|$)", "/{id}", endpoint.strip("/"))
+
+def _itens_endpoint(chave: str) -> int:
+    """Tamanho de página atual do endpoint, subindo um tamanho a cada ITENS_RECUPERACAO_SECONDS."""
+    with _itens_lock:
+        if chave not in _itens_por_endpoint:
+            return ITENS_ESCALA[0]
+        itens, desde = _itens_por_endpoint[chave]
+        periodos = int((time.monotonic() - desde) // ITENS_RECUPERACAO_SECONDS)
+        if periodos > 0:
+            posicao = max(0, ITENS_ESCALA.index(itens) - periodos)
+            itens = ITENS_ESCALA[posicao]
+            if posicao == 0:
+                del _itens_por_endpoint[chave]
+            else:
+                _itens_por_endpoint[chave] = (itens, desde + periodos * ITENS_RECUPERACAO_SECONDS)
+        return itens
+
+def _reduzir_itens(chave: str, atual: int) -> Optional[int]:
+    """Registra o próximo tamanho menor para o endpoint e o retorna (None se já é o mínimo)."""
+    menores = [i for i in ITENS_ESCALA if i < atual]
+    if not menores:
+        return None
+    with _itens_lock:
+        registrado = _itens_por_endpoint.get(chave, (ITENS_ESCALA[0], 0.0))[0]
+        if registrado >= menores[0]:
+            _itens_por_endpoint[chave] = (menores[0], time.monotonic())
+    return menores[0]
+
+def _reescalar(url: str, params: Optional[Dict[str, Any]], antigo: int, novo: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Troca `itens` de uma página mantendo a posição: pagina' = (pagina - 1) * antigo / novo + 1."""
+    fator = antigo // novo
+    if params is not None:
+        pagina = int(params.get("pagina", 1))
+        return url, dict(params, itens=novo, pagina=(pagina - 1) * fator + 1)
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    pagina = int(query.get("pagina", 1))
+    query.update(itens=str(novo), pagina=str((pagina - 1) * fator + 1))
+    return urlunsplit(parts._replace(query=urlencode(query))), None
+
+def _iter_pages(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: int = 3,
+    parallel: Optional[bool] = None,
+    max_workers: int = MAX_WORKERS,
+    prefetch: bool = False,
+    retry_gateway_timeout: bool = True,
+    completo: bool = False
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Gera, em ordem, as páginas (listas de itens) de um resultado paginado.
+
+    No modo paralelo (`parallel=True` ou `PARALLEL_PAGES`), a primeira página
+    informa o total de páginas pelo link `last` e as demais são buscadas em
+    paralelo, com no máximo `max_workers` requisições simultâneas.
+    No modo sequencial, `prefetch=True` busca a próxima página enquanto a
+    atual é consumida.
+
+    Se `params` não define `itens` (e o chamador não trata o 504 por conta
+    própria), usa o tamanho de página atual do endpoint (ITENS_ESCALA) e reduz
+    em caso de 504 persistente. Nesse caso `max_pages` conta páginas do maior
+    tamanho: ao reduzir `itens`, o número de páginas cresce na mesma proporção
+    e a quantidade de registros retornados não muda.
+
+    Com `completo=True`, se o limite terminar antes da última página, levanta
+    PaginacaoIncompletaError depois de gerar as páginas já buscadas.
+    """
+    if parallel is None:
+        parallel = PARALLEL_PAGES
+    if max_pages < 1:
+        return
     
-    while url and page_count < max_pages:
-        if page_count > 0:
-            sleep(1.5)
-            
-        data = _get(url, params)
-        page_data = data.get("dados", [])
-        results.extend(page_data)
+    get = partial(_get, retry_gateway_timeout=retry_gateway_timeout)
+    chave = _endpoint_key(endpoint)
+    adaptativo = retry_gateway_timeout and "itens" not in (params or {})
+    itens = _itens_endpoint(chave)
+    if adaptativo:
+        params = dict(params or {}, itens=itens)
+    
+    # Orçamento em unidades de `peso()`: registros no modo adaptativo, páginas no fixo
+    orcamento = max_pages * ITENS_ESCALA[0] if adaptativo else max_pages
+    
+    def peso() -> int:
+        return itens if adaptativo else 1
+    
+    def buscar(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        nonlocal itens
+        timeouts = 0
+        while True:
+            pode_reduzir = adaptativo and itens > ITENS_ESCALA[-1]
+            _ultima_resposta.elapsed = 0.0
+            try:
+                data = _get(url, params, retry_gateway_timeout=retry_gateway_timeout and not pode_reduzir)
+            except CamaraGatewayTimeoutError:
+                if not pode_reduzir:
+                    raise
+                timeouts += 1
+                if timeouts < ITENS_TENTATIVAS_504:
+                    # Um 504 isolado pode ser só um pico: repete no mesmo tamanho antes de reduzir
+                    print(f"⏳ Gateway timeout em {chave} com itens={itens}, tentando novamente...")
+                    sleep(RETRY_BACKOFF)
+                    continue
+                timeouts = 0
+                novo = _reduzir_itens(chave, itens)
+                print(f"⏳ Gateway timeout em {chave} com itens={itens}, tentando itens={novo}...")
+                url, params = _reescalar(url, params, itens, novo)
+                itens = novo
+                continue
+            if adaptativo and _ultima_resposta.elapsed > SLOW_RESPONSE_SECONDS:
+                # Resposta lenta: as próximas chamadas ao endpoint usam páginas menores
+                _reduzir_itens(chave, itens)
+            return data
+    
+    data = buscar(f"{BASE_URL}/{endpoint}", params)
+    
+    if parallel and orcamento > peso():
+        last_link = _link(data, "last")
+        last_page = _page_number(last_link) if last_link else None
         
-        links = data.get("links", [])
-        next_link = next((l["href"] for l in links if l["rel"] == "next"), None)
-        url = next_link
-        params = None # Parâmetros já estão no `next_link`
-        page_count += 1
+        if last_page is not None:
+            paginas = orcamento // peso()
+            incompleto = completo and last_page > paginas
+            urls = [_page_url(last_link, p) for p in range(2, min(last_page, paginas) + 1)]
+            if not urls:
+                yield data.get("dados", [])
+                if incompleto:
+                    raise PaginacaoIncompletaError(f"{endpoint}: limite de {max_pages} páginas atingido")
+                return
+            executor = criar_executor(min(max_workers, len(urls)))
+            try:
+                # `map` dispara todas as páginas e devolve os resultados na ordem
+                pages = executor.map(get, urls)
+                yield data.get("dados", [])
+                for page in pages:
+                    yield page.get("dados", [])
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if incompleto:
+                raise PaginacaoIncompletaError(f"{endpoint}: limite de {max_pages} páginas atingido")
+            return
+        # Sem link `last` utilizável: segue o link `next` sequencialmente
     
+    # O intervalo entre páginas é controlado pelo token bucket em `_get`
+    executor = criar_executor(1) if prefetch else None
+    try:
+        consumido = peso()
+        while True:
+            # Parâmetros já estão no link `next`
+            next_url = _link(data, "next") if consumido < orcamento else None
+            pending = executor.submit(buscar, next_url) if executor and next_url else None
+            yield data.get("dados", [])
+            if not next_url:
+                if completo and _link(data, "next"):
+                    raise PaginacaoIncompletaError(f"{endpoint}: limite de {max_pages} páginas atingido")
+                return
+            data = pending.result() if pending else buscar(next_url)
+            consumido += peso()
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+# Corte por data (`since`): campo usado para ordenar no servidor (DESC) e campo do
+# item comparado com o corte. Tramitações não aceitam ordenação, mas aceitam filtro.
+_CAMPOS_CORTE = {
+    "deputados/{id}/despesas": ("dataDocumento", "dataDocumento"),
+    "deputados/{id}/discursos": ("dataHoraInicio", "dataHoraInicio"),
+    "deputados/{id}/eventos": ("dataHoraInicio", "dataHoraInicio"),
+    "eventos": ("dataHoraInicio", "dataHoraInicio"),
+    "orgaos/{id}/eventos": ("dataHoraInicio", "dataHoraInicio"),
+    "votacoes": ("dataHoraRegistro", "dataHoraRegistro"),
+    "orgaos/{id}/votacoes": ("dataHoraRegistro", "dataHoraRegistro"),
+}
+_FILTROS_CORTE = {
+    "proposicoes/{id}/tramitacoes": "dataInicio",
+}
+
+StopPredicate = Callable[[Dict[str, Any]], bool]
+
+def _normalizar_corte(since: Any) -> str:
+    """Corte no formato das datas da API (AAAA-MM-DD ou AAAA-MM-DDTHH:MM[:SS])."""
+    if isinstance(since, datetime):
+        since = since.replace(tzinfo=None)
+        if since.second == 0 and since.microsecond == 0:
+            return since.isoformat(timespec="minutes")
+        return since.isoformat(timespec="seconds")
+    if isinstance(since, date):
+        return since.isoformat()
+    return str(since)
+
+def _aplicar_corte(
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    since: Optional[Any],
+    parar_quando: Optional[StopPredicate]
+) -> Tuple[Optional[Dict[str, Any]], Optional[StopPredicate]]:
+    """
+    Converte `since` (data/hora ISO, date ou datetime) em ordenação decrescente no
+    servidor mais um predicado de parada, combinado com `parar_quando` se ambos
+    forem informados. `ordenarPor`/`ordem` diferentes dos exigidos pelo corte
+    levantam ValueError (a paginação pararia no primeiro item).
+    """
+    if since is None:
+        return params, parar_quando
+    since = _normalizar_corte(since)
+    chave = _endpoint_key(endpoint)
+    
+    if chave in _FILTROS_CORTE:
+        return dict(params or {}, **{_FILTROS_CORTE[chave]: since[:10]}), parar_quando
+    if chave not in _CAMPOS_CORTE:
+        raise ValueError(f"`since` não é suportado para o endpoint {chave}")
+    
+    ordenar_por, campo = _CAMPOS_CORTE[chave]
+    params = dict(params or {})
+    if str(params.setdefault("ordenarPor", ordenar_por)) != ordenar_por:
+        raise ValueError(f"`since` exige ordenarPor={ordenar_por} em {chave}")
+    if str(params.setdefault("ordem", "DESC")).upper() != "DESC":
+        raise ValueError(f"`since` exige ordem=DESC em {chave}")
+    
+    def antes_do_corte(item: Dict[str, Any]) -> bool:
+        valor = item.get(campo)
+        return bool(valor) and str(valor) < since
+    
+    if parar_quando is None:
+        return params, antes_do_corte
+    return params, lambda item: antes_do_corte(item) or parar_quando(item)
+
+def _get_limited_pages(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: int = 3,
+    parallel: Optional[bool] = None,
+    max_workers: int = MAX_WORKERS,
+    retry_gateway_timeout: bool = True,
+    since: Optional[Any] = None,
+    parar_quando: Optional[StopPredicate] = None,
+    completo: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Percorre um número limitado de páginas de um resultado.
+    Com `since` ou `parar_quando`, a paginação é sequencial e termina no
+    primeiro item que cruza o corte (ver `_iter_items`). Com `completo=True`,
+    levanta PaginacaoIncompletaError se `max_pages` não bastar para o resultado.
+    """
+    if since is not None or parar_quando is not None:
+        return list(_iter_items(endpoint, params, max_pages, since=since, parar_quando=parar_quando, completo=completo))
+    
+    results = []
+    for page in _iter_pages(endpoint, params, max_pages, parallel, max_workers,
+                            retry_gateway_timeout=retry_gateway_timeout, completo=completo):
+        results.extend(page)
     return results
 
+def _iter_items(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: int = 3,
+    prefetch: bool = False,
+    since: Optional[Any] = None,
+    parar_quando: Optional[StopPredicate] = None,
+    completo: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Versão preguiçosa de `_get_limited_pages`: gera os itens página a página.
+
+    `since` (data ou data/hora ISO) pede ao servidor ordem decrescente de data e
+    para no primeiro item mais antigo que o corte; `parar_quando(item)` para no
+    primeiro item em que o predicado for verdadeiro. Nenhuma página além da que
+    cruzou o corte é buscada.
+    """
+    params, parar_quando = _aplicar_corte(endpoint, params, since, parar_quando)
+    for page in _iter_pages(endpoint, params, max_pages, parallel=False, prefetch=prefetch, completo=completo):
+        for item in page:
+            if parar_quando is not None and parar_quando(item):
+                return
+            yield item
+
+def abrir_documento(url: str) -> requests.Response:
+    """
+    GET em streaming de um arquivo (ex.: `urlInteiroTeor`), pelo mesmo pool de
+    conexões e limite de requisições do cliente. O chamador deve fechar a resposta.
+    """
+    _rate_limiter.acquire(priority=prioridade_atual())
+    try:
+        response = _session.get(url, stream=True, timeout=TIMEOUT, headers={"Accept": "*/*"})
+        response.raise_for_status()
+        return response
+    except requests.HTTPError as e:
+        status = e.response.status_code if e.response is not None else "N/A"
+        raise CamaraAPIError(f"Erro HTTP {status} ao baixar {url}") from e
+    except requests.RequestException as e:
+        raise CamaraAPIError(f"Erro de rede ao baixar {url}: {e}") from e
+
+def _obter_em_lote(
+    endpoint: str,
+    ids: Sequence[int],
+    obter_um: Callable[[int], Dict[str, Any]],
+    campos_detalhe: Optional[Sequence[str]] = None,
+    max_workers: int = MAX_WORKERS
+) -> List[Dict[str, Any]]:
+    """
+    Busca vários registros de uma vez pelo endpoint de listagem com `id=` repetido,
+    em lotes de ID_BATCH_SIZE executados em paralelo.
+
+    Ids ausentes da listagem, ou cujos itens não tragam algum dos `campos_detalhe`,
+    são completados com a chamada de detalhe `obter_um`. O resultado segue a
+    ordem de `ids` (sem repetições).
+    """
+    ids = list(dict.fromkeys(int(i) for i in ids))
+    lotes = [ids[i:i + ID_BATCH_SIZE] for i in range(0, len(ids), ID_BATCH_SIZE)]
+    
+    def buscar_lote(lote: List[int]) -> List[Dict[str, Any]]:
+        return _get_limited_pages(endpoint, {"id": lote, "itens": len(lote)},
+                                  max_pages=1, parallel=False)
+    
+    encontrados: Dict[int, Dict[str, Any]] = {}
+    with criar_executor(max(1, min(max_workers, len(lotes)))) as executor:
+        for itens in executor.map(buscar_lote, lotes):
+            for item in itens:
+                encontrados[item["id"]] = item
+        
+        # Fallback: detalhe individual só para o que a listagem não cobriu
+        faltantes = [
+            i for i in ids
+            if i not in encontrados or any(c not in encontrados[i] for c in (campos_detalhe or ()))
+        ]
+        for id_, detalhe in zip(faltantes, executor.map(obter_um, faltantes)):
+            encontrados[id_] = {**encontrados.get(id_, {}), **detalhe}
+    
+    return [encontrados[i] for i in ids]
+
+# ==========================
+# Cache de dados históricos
+# ==========================
+
+# Desligado por padrão; ative com `configurar_cache()`. Respostas classificadas como
+# imutáveis (votações passadas, legislaturas encerradas, meses de despesas fechados)
+# ficam no disco para sempre; as demais expiram após CACHE_TTL_MUTAVEL segundos.
+CACHE_PATH = "camara_cache.sqlite3"
+CACHE_TTL_MUTAVEL = 3600
+
+# Prazo após o fim do mês em que despesas ainda podem ser lançadas ou corrigidas
+DESPESAS_DIAS_FECHAMENTO = 90
+
+# Limite de páginas ao buscar um período de despesas fechado (que vai inteiro para o cache)
+DESPESAS_MAX_PAGES_FECHADAS = 50
+
+_cache: Optional[DiskCache] = None
+
+def configurar_cache(caminho: Optional[str] = CACHE_PATH, ttl_mutavel: int = CACHE_TTL_MUTAVEL) -> None:
+    """Ativa o cache em disco no arquivo informado (`caminho=None` desativa)."""
+    global _cache, CACHE_TTL_MUTAVEL
+    CACHE_TTL_MUTAVEL = ttl_mutavel
+    _cache = DiskCache(caminho) if caminho else None
+
+def _com_cache(chave: str, buscar: Callable[[], Any], imutavel: Callable[[Any], bool]) -> Any:
+    """Consulta o cache; na falta, busca e grava como permanente ou com TTL curto."""
+    if _cache is None:
+        return buscar()
+    encontrado, valor = _cache.get(chave)
+    if encontrado:
+        return valor
+    valor = buscar()
+    _cache.set(chave, valor, ttl=None if imutavel(valor) else CACHE_TTL_MUTAVEL)
+    return valor
+
+def _buscar_completo(endpoint: str, params: Optional[Dict[str, Any]], max_pages: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Busca até `max_pages` páginas e informa se a paginação chegou ao fim. Usado
+    antes de gravar no cache permanente, que não deve guardar um resultado cortado.
+    """
+    itens: List[Dict[str, Any]] = []
+    try:
+        for item in _iter_items(endpoint, params, max_pages, completo=True):
+            itens.append(item)
+    except PaginacaoIncompletaError:
+        return itens, False
+    return itens, True
+
+def _chave_cache(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    url, params_json = request_key(endpoint, params)
+    return f"{url}?{params_json}"
+
+def _no_passado(valor: Optional[Any], margem_dias: int = 0) -> bool:
+    """Verdadeiro se a data/hora ISO `valor` é anterior a hoje menos `margem_dias`."""
+    if not valor:
+        return False
+    return str(valor)[:10] < (date.today() - timedelta(days=margem_dias)).isoformat()
+
+def _despesas_fechadas(params: Optional[Dict[str, Any]]) -> bool:
+    """Despesas de um único mês (ou ano) encerrado há mais de DESPESAS_DIAS_FECHAMENTO dias."""
+    params = params or {}
+    ano, mes = params.get('ano'), params.get('mes')
+    if ano is None or isinstance(ano, (list, tuple)) or isinstance(mes, (list, tuple)):
+        return False
+    ano = int(ano)
+    if mes is None:
+        fim = date(ano, 12, 31)
+    else:
+        mes = int(mes)
+        fim = date(ano + mes // 12, mes % 12 + 1, 1) - timedelta(days=1)
+    return (date.today() - fim).days > DESPESAS_DIAS_FECHAMENTO
+
 # ==========================
 # Endpoints: Deputados
 # ==========================
@@ -108,24 +664,62 @@ def _get_limited_pages(endpoint: str, params: Optional[Dict[str, Any]] = None, m
 def listar_deputados(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages("deputados", params)
 
+def iter_deputados(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items("deputados", params, max_pages, prefetch)
+
 def obter_deputado(id_deputado: int) -> Dict[str, Any]:
     return _get(f"{BASE_URL}/deputados/{id_deputado}")['dados']
 
-def despesas_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"deputados/{id_deputado}/despesas", params, max_pages=2)
+def obter_deputados(ids: Sequence[int], campos_detalhe: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    """Busca vários deputados em lote. Ex.: campos_detalhe=['cpf', 'ultimoStatus']"""
+    return _obter_em_lote("deputados", ids, obter_deputado, campos_detalhe)
+
+def despesas_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> List[Dict[str, Any]]:
+    endpoint = f"deputados/{id_deputado}/despesas"
+    if since is not None or parar_quando is not None:
+        return _get_limited_pages(endpoint, params, max_pages=2, since=since, parar_quando=parar_quando)
+    if _cache is None or not _despesas_fechadas(params):
+        return _com_cache(_chave_cache(endpoint, params),
+                          lambda: _get_limited_pages(endpoint, params, max_pages=2),
+                          lambda _: False)
+    # Com o cache ativo, meses fechados (ex.: {'ano': 2023, 'mes': 5}) são buscados
+    # por inteiro e ficam no cache permanentemente se nenhuma página ficou de fora
+    completas = False
+    
+    def buscar() -> List[Dict[str, Any]]:
+        nonlocal completas
+        despesas, completas = _buscar_completo(endpoint, params, DESPESAS_MAX_PAGES_FECHADAS)
+        return despesas
+    
+    return _com_cache(_chave_cache(endpoint, params), buscar, lambda _: completas)
+
+def iter_despesas_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"deputados/{id_deputado}/despesas", params, max_pages, prefetch, since=since, parar_quando=parar_quando)
+
+def discursos_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> List[Dict[str, Any]]:
+    return _get_limited_pages(f"deputados/{id_deputado}/discursos", params, max_pages=2, since=since, parar_quando=parar_quando)
+
+def iter_discursos_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"deputados/{id_deputado}/discursos", params, max_pages, prefetch, since=since, parar_quando=parar_quando)
 
-def discursos_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"deputados/{id_deputado}/discursos", params, max_pages=2)
+def eventos_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> List[Dict[str, Any]]:
+    return _get_limited_pages(f"deputados/{id_deputado}/eventos", params, since=since, parar_quando=parar_quando)
 
-def eventos_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"deputados/{id_deputado}/eventos", params)
+def iter_eventos_deputado(id_deputado: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"deputados/{id_deputado}/eventos", params, max_pages, prefetch, since=since, parar_quando=parar_quando)
 
 def orgaos_deputado(id_deputado: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"deputados/{id_deputado}/orgaos")
 
+def iter_orgaos_deputado(id_deputado: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"deputados/{id_deputado}/orgaos", None, max_pages, prefetch)
+
 def ocupacoes_deputado(id_deputado: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"deputados/{id_deputado}/ocupacoes")
 
+def iter_ocupacoes_deputado(id_deputado: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"deputados/{id_deputado}/ocupacoes", None, max_pages, prefetch)
+
 # ==========================
 # Endpoints: Partidos
 # ==========================
@@ -133,12 +727,18 @@ def ocupacoes_deputado(id_deputado: int) -> List[Dict[str, Any]]:
 def listar_partidos(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages("partidos", params)
 
+def iter_partidos(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items("partidos", params, max_pages, prefetch)
+
 def obter_partido(id_partido: int) -> Dict[str, Any]:
     return _get(f"{BASE_URL}/partidos/{id_partido}")['dados']
 
 def membros_partido(id_partido: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"partidos/{id_partido}/membros", max_pages=2)
 
+def iter_membros_partido(id_partido: int, max_pages: int = 2, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"partidos/{id_partido}/membros", None, max_pages, prefetch)
+
 # ==========================
 # Endpoints: Blocos
 # ==========================
@@ -146,12 +746,18 @@ def membros_partido(id_partido: int) -> List[Dict[str, Any]]:
 def listar_blocos(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages("blocos", params)
 
+def iter_blocos(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items("blocos", params, max_pages, prefetch)
+
 def obter_bloco(id_bloco: int) -> Dict[str, Any]:
     return _get(f"{BASE_URL}/blocos/{id_bloco}")['dados']
 
 def membros_bloco(id_bloco: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"blocos/{id_bloco}/membros")
 
+def iter_membros_bloco(id_bloco: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"blocos/{id_bloco}/membros", None, max_pages, prefetch)
+
 # ==========================
 # Endpoints: Frentes
 # ==========================
@@ -159,12 +765,18 @@ def membros_bloco(id_bloco: int) -> List[Dict[str, Any]]:
 def listar_frentes(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages("frentes", params)
 
+def iter_frentes(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items("frentes", params, max_pages, prefetch)
+
 def obter_frente(id_frente: int) -> Dict[str, Any]:
     return _get(f"{BASE_URL}/frentes/{id_frente}")['dados']
 
 def membros_frente(id_frente: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"frentes/{id_frente}/membros")
 
+def iter_membros_frente(id_frente: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"frentes/{id_frente}/membros", None, max_pages, prefetch)
+
 # ==========================
 # Endpoints: Legislaturas
 # ==========================
@@ -172,14 +784,31 @@ def membros_frente(id_frente: int) -> List[Dict[str, Any]]:
 def listar_legislaturas(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages("legislaturas", params)
 
+def iter_legislaturas(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items("legislaturas", params, max_pages, prefetch)
+
 def obter_legislatura(id_legislatura: int) -> Dict[str, Any]:
-    return _get(f"{BASE_URL}/legislaturas/{id_legislatura}")['dados']
+    return _com_cache(
+        f"legislaturas/{id_legislatura}",
+        lambda: _get(f"{BASE_URL}/legislaturas/{id_legislatura}")['dados'],
+        lambda legislatura: _no_passado(legislatura.get('dataFim'))
+    )
 
 def deputados_legislatura(id_legislatura: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"legislaturas/{id_legislatura}/deputados", params, max_pages=2)
 
+def iter_deputados_legislatura(id_legislatura: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"legislaturas/{id_legislatura}/deputados", params, max_pages, prefetch)
+
 def mesa_legislatura(id_legislatura: int) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"legislaturas/{id_legislatura}/mesa")
+    return _com_cache(
+        f"legislaturas/{id_legislatura}/mesa",
+        lambda: _get_limited_pages(f"legislaturas/{id_legislatura}/mesa"),
+        lambda _: _no_passado(obter_legislatura(id_legislatura).get('dataFim'))
+    )
+
+def iter_mesa_legislatura(id_legislatura: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"legislaturas/{id_legislatura}/mesa", None, max_pages, prefetch)
 
 # ==========================
 # Endpoints: Proposições
@@ -188,38 +817,142 @@ def mesa_legislatura(id_legislatura: int) -> List[Dict[str, Any]]:
 def listar_proposicoes(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages("proposicoes", params)
 
+def iter_proposicoes(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False, completo: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items("proposicoes", params, max_pages, prefetch, completo=completo)
+
 def obter_proposicao(id_prop: int) -> Dict[str, Any]:
     return _get(f"{BASE_URL}/proposicoes/{id_prop}")['dados']
 
+def obter_proposicoes(ids: Sequence[int], campos_detalhe: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Busca várias proposições em lote (id, siglaTipo, numero, ano, ementa). Campos que
+    só existem no detalhe, como statusProposicao e urlInteiroTeor, nunca vêm da
+    listagem: pedi-los em `campos_detalhe` faz uma chamada de detalhe por id, e aí
+    é mais barato chamar `obter_proposicao` direto.
+    """
+    return _obter_em_lote("proposicoes", ids, obter_proposicao, campos_detalhe)
+
 def temas_proposicao(id_prop: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"proposicoes/{id_prop}/temas")
 
+def iter_temas_proposicao(id_prop: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"proposicoes/{id_prop}/temas", None, max_pages, prefetch)
+
 def autores_proposicao(id_prop: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"proposicoes/{id_prop}/autores")
 
-def tramitacoes_proposicao(id_prop: int) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"proposicoes/{id_prop}/tramitacoes", max_pages=2)
+def iter_autores_proposicao(id_prop: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"proposicoes/{id_prop}/autores", None, max_pages, prefetch)
+
+def tramitacoes_proposicao(id_prop: int, params: Optional[Dict[str, Any]] = None, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> List[Dict[str, Any]]:
+    return _get_limited_pages(f"proposicoes/{id_prop}/tramitacoes", params, max_pages=2, since=since, parar_quando=parar_quando)
+
+def iter_tramitacoes_proposicao(id_prop: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"proposicoes/{id_prop}/tramitacoes", params, max_pages, prefetch, since=since, parar_quando=parar_quando)
 
 def votacoes_proposicao(id_prop: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"proposicoes/{id_prop}/votacoes")
 
+def iter_votacoes_proposicao(id_prop: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"proposicoes/{id_prop}/votacoes", None, max_pages, prefetch)
+
 # ==========================
 # Endpoints: Votações (OTIMIZADO)
 # ==========================
 
-def listar_votacoes(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+# Tamanho padrão das janelas de data usadas por `listar_votacoes`
+VOTACOES_JANELA_DIAS = 7
+
+# Limite de páginas dos votos de uma votação (513 deputados cabem com folga)
+VOTOS_MAX_PAGES = 10
+
+def listar_votacoes(
+    params: Optional[Dict[str, Any]] = None,
+    max_pages: int = 10,
+    janela_dias: int = VOTACOES_JANELA_DIAS,
+    max_workers: int = MAX_WORKERS
+) -> List[Dict[str, Any]]:
     """
     Lista votações com filtros opcionais.
 
     IMPORTANTE: Este endpoint é muito propenso a timeouts (erro 504 Gateway Timeout)
-    se não for usado com um intervalo de datas ('dataInicio' e 'dataFim').
+    com intervalos de datas longos ou sem intervalo ('dataInicio' e 'dataFim').
 
-    SOLUÇÃO: Se nenhum intervalo de data for fornecido, a função buscará
-    automaticamente as votações dos ÚLTIMOS 7 DIAS para evitar o erro.
+    SOLUÇÃO: O intervalo é dividido em janelas de `janela_dias` dias, buscadas
+    em paralelo (até `max_workers`, com no máximo `max_pages` páginas cada).
+    Uma janela que recebe 504 é dividida ao meio e refeita. Os resultados são
+    unidos sem duplicatas e ordenados por 'ordenarPor'/'ordem'.
 
-    Para buscas mais antigas, sempre forneça as datas. Exemplo:
-    listar_votacoes({'dataInicio': '2023-01-01', 'dataFim': '2023-01-31'})
+    Se nenhum intervalo de data for fornecido, a função buscará
+    automaticamente as votações dos ÚLTIMOS 7 DIAS. Exemplo com um ano inteiro:
+    listar_votacoes({'dataInicio': '2023-01-01', 'dataFim': '2023-12-31'})
     """
+    params = _votacoes_params(dict(params or {}))
+    params.setdefault('ordenarPor', 'dataHoraRegistro')
+    params.setdefault('ordem', 'DESC')
+
+    if 'dataInicio' not in params:
+        # Só a data final foi informada: não há intervalo para dividir
+        return _get_limited_pages("votacoes", params, max_pages=max_pages)
+    
+    inicio = date.fromisoformat(str(params['dataInicio']))
+    fim = date.fromisoformat(str(params.get('dataFim') or date.today().isoformat()))
+    janelas = _janelas_de_datas(inicio, fim, janela_dias)
+    
+    buscar = partial(_votacoes_janela, params, max_pages=max_pages)
+    with criar_executor(max(1, min(max_workers, len(janelas)))) as executor:
+        partes = list(executor.map(lambda janela: buscar(*janela), janelas))
+    
+    # Une as janelas removendo votações repetidas nas bordas
+    vistos = set()
+    results = []
+    for parte in partes:
+        for item in parte:
+            chave = item.get('id')
+            if chave in vistos:
+                continue
+            vistos.add(chave)
+            results.append(item)
+    
+    campo = params['ordenarPor']
+    results.sort(key=lambda item: _chave_ordenacao(item.get(campo)),
+                 reverse=str(params['ordem']).upper() == 'DESC')
+    return results
+
+def _chave_ordenacao(valor: Any) -> Tuple[int, Any]:
+    """Números comparam pelo valor (9 antes de 10); o resto como texto, depois dos números."""
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        return (0, valor)
+    return (1, '' if valor is None else str(valor))
+
+def _janelas_de_datas(inicio: date, fim: date, dias: int) -> List[Tuple[date, date]]:
+    """Divide o intervalo fechado [inicio, fim] em janelas de até `dias` dias."""
+    janelas = []
+    while inicio <= fim:
+        janela_fim = min(fim, inicio + timedelta(days=max(1, dias) - 1))
+        janelas.append((inicio, janela_fim))
+        inicio = janela_fim + timedelta(days=1)
+    return janelas
+
+def _votacoes_janela(params: Dict[str, Any], inicio: date, fim: date, max_pages: int) -> List[Dict[str, Any]]:
+    """Busca uma janela de votações, dividindo-a ao meio em caso de 504."""
+    janela = dict(params, dataInicio=inicio.isoformat(), dataFim=fim.isoformat())
+    # `itens` explícito desliga o ajuste de tamanho de página: o 504 divide a janela
+    janela.setdefault('itens', ITENS_ESCALA[0])
+    try:
+        # Janelas de um dia não podem mais ser divididas: usam as retentativas normais
+        return _get_limited_pages("votacoes", janela, max_pages=max_pages, parallel=False,
+                                  retry_gateway_timeout=(inicio == fim))
+    except CamaraGatewayTimeoutError:
+        if inicio == fim:
+            raise
+        meio = inicio + (fim - inicio) // 2
+        print(f"⏳ Gateway timeout em {inicio}..{fim}, dividindo a janela...")
+        return (_votacoes_janela(params, inicio, meio, max_pages)
+                + _votacoes_janela(params, meio + timedelta(days=1), fim, max_pages))
+
+def _votacoes_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aplica o intervalo padrão dos últimos 7 dias quando nenhuma data é informada."""
     if params is None:
         params = {}
 
@@ -233,22 +966,49 @@ def listar_votacoes(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, A
         # Adiciona uma ordenação padrão para consistência
         params.setdefault('ordenarPor', 'dataHoraRegistro')
         params.setdefault('ordem', 'DESC')
+    return params
 
-    # Limita a busca a 2 páginas por segurança, mas o usuário pode aumentar se precisar.
-    return _get_limited_pages("votacoes", params, max_pages=2)
+def iter_votacoes(params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    if since is not None and not any(k in (params or {}) for k in ('dataInicio', 'dataFim')):
+        # Sem datas explícitas, o próprio corte define o início do intervalo
+        params = dict(params or {}, dataInicio=_normalizar_corte(since)[:10], dataFim=date.today().isoformat())
+    return _iter_items("votacoes", _votacoes_params(params), max_pages, prefetch, since=since, parar_quando=parar_quando)
 
 def obter_votacao(id_votacao: int) -> Dict[str, Any]:
-    return _get(f"{BASE_URL}/votacoes/{id_votacao}")['dados']
+    return _com_cache(
+        f"votacoes/{id_votacao}",
+        lambda: _get(f"{BASE_URL}/votacoes/{id_votacao}")['dados'],
+        lambda votacao: _no_passado(votacao.get('dataHoraRegistro'), margem_dias=1)
+    )
 
 def votos_votacao(id_votacao: int) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"votacoes/{id_votacao}/votos", max_pages=2)
+    completos = False
+    
+    def buscar() -> List[Dict[str, Any]]:
+        nonlocal completos
+        votos, completos = _buscar_completo(f"votacoes/{id_votacao}/votos", None, VOTOS_MAX_PAGES)
+        return votos
+    
+    # Votos registrados há mais de um dia não mudam mais (se a lista veio inteira)
+    return _com_cache(
+        f"votacoes/{id_votacao}/votos",
+        buscar,
+        lambda votos: completos and bool(votos)
+                      and all(_no_passado(v.get('dataRegistroVoto'), margem_dias=1) for v in votos)
+    )
+
+def iter_votos_votacao(id_votacao: int, max_pages: int = 2, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"votacoes/{id_votacao}/votos", None, max_pages, prefetch)
 
 # ==========================
 # Endpoints: Eventos
 # ==========================
 
-def listar_eventos(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    return _get_limited_pages("eventos", params)
+def listar_eventos(params: Optional[Dict[str, Any]] = None, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> List[Dict[str, Any]]:
+    return _get_limited_pages("eventos", params, since=since, parar_quando=parar_quando)
+
+def iter_eventos(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_items("eventos", params, max_pages, prefetch, since=since, parar_quando=parar_quando)
 
 def obter_evento(id_evento: int) -> Dict[str, Any]:
     return _get(f"{BASE_URL}/eventos/{id_evento}")['dados']
@@ -256,12 +1016,21 @@ def obter_evento(id_evento: int) -> Dict[str, Any]:
 def deputados_evento(id_evento: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"eventos/{id_evento}/deputados")
 
+def iter_deputados_evento(id_evento: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"eventos/{id_evento}/deputados", None, max_pages, prefetch)
+
 def orgaos_evento(id_evento: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"eventos/{id_evento}/orgaos")
 
+def iter_orgaos_evento(id_evento: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"eventos/{id_evento}/orgaos", None, max_pages, prefetch)
+
 def pauta_evento(id_evento: int) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"eventos/{id_evento}/pauta")
 
+def iter_pauta_evento(id_evento: int, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"eventos/{id_evento}/pauta", None, max_pages, prefetch)
+
 # ==========================
 # Endpoints: Órgãos
 # ==========================
@@ -269,17 +1038,29 @@ def pauta_evento(id_evento: int) -> List[Dict[str, Any]]:
 def listar_orgaos(params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages("orgaos", params)
 
+def iter_orgaos(params: Optional[Dict[str, Any]] = None, max_pages: int = 3, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items("orgaos", params, max_pages, prefetch)
+
 def obter_orgao(id_orgao: int) -> Dict[str, Any]:
     return _get(f"{BASE_URL}/orgaos/{id_orgao}")['dados']
 
 def deputados_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     return _get_limited_pages(f"orgaos/{id_orgao}/deputados", params, max_pages=2)
 
-def eventos_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"orgaos/{id_orgao}/eventos", params, max_pages=2)
+def iter_deputados_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"orgaos/{id_orgao}/deputados", params, max_pages, prefetch)
+
+def eventos_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> List[Dict[str, Any]]:
+    return _get_limited_pages(f"orgaos/{id_orgao}/eventos", params, max_pages=2, since=since, parar_quando=parar_quando)
+
+def iter_eventos_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"orgaos/{id_orgao}/eventos", params, max_pages, prefetch, since=since, parar_quando=parar_quando)
+
+def votacoes_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> List[Dict[str, Any]]:
+    return _get_limited_pages(f"orgaos/{id_orgao}/votacoes", params, max_pages=2, since=since, parar_quando=parar_quando)
 
-def votacoes_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    return _get_limited_pages(f"orgaos/{id_orgao}/votacoes", params, max_pages=2)
+def iter_votacoes_orgao(id_orgao: int, params: Optional[Dict[str, Any]] = None, max_pages: int = 2, prefetch: bool = False, since: Optional[str] = None, parar_quando: Optional[StopPredicate] = None) -> Iterator[Dict[str, Any]]:
+    return _iter_items(f"orgaos/{id_orgao}/votacoes", params, max_pages, prefetch, since=since, parar_quando=parar_quando)
 
 # ==========================
 # Endpoints: Referências/Tabelas Auxiliares
@@ -0,0 +1,336 @@
+# camara_documentos.py - Download em massa do inteiro teor das proposições
+#
+# Resolve o `urlInteiroTeor` de cada proposição, baixa os arquivos com concorrência
+# limitada (escrita em streaming direto para o disco) à medida que as URLs chegam e
+# guarda cada conteúdo uma única vez, pelo hash SHA-256. A extração de texto
+# (PDF/HTML) roda em um pool de processos para não travar as threads de download.
+#
+# Um manifesto SQLite no diretório de destino registra as URLs resolvidas (inclusive
+# a falta de inteiro teor) e o que já foi baixado e extraído: execuções seguintes
+# pulam esses passos e retomam o que faltou.
+#
+# Uso: python camara_documentos.py 2024 [--tipo PL] [--dir documentos] [--workers 8] [--processos 2]
+#
+# PDFs dependem do pypdf (opcional); sem ele os arquivos são baixados, mas o texto
+# fica pendente até a próxima execução com o pacote instalado.
+
+import argparse
+import hashlib
+import html
+import os
+import re
+import sqlite3
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import camara_client
+
+DIRETORIO = "documentos"
+MANIFESTO = "documentos.sqlite3"
+MAX_WORKERS = 8
+MAX_PAGES_LISTAGEM = 500
+CHUNK_SIZE = 64 * 1024
+# Proposições sem inteiro teor são consultadas de novo depois deste prazo
+DIAS_RECHECAR_SEM_URL = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    id_proposicao INTEGER PRIMARY KEY,
+    url TEXT,
+    resolvido_em TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documentos (
+    id_proposicao INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    baixado_em TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documentos_sha256 ON documentos(sha256);
+CREATE TABLE IF NOT EXISTS conteudos (
+    sha256 TEXT PRIMARY KEY,
+    arquivo TEXT NOT NULL,
+    content_type TEXT,
+    tamanho INTEGER NOT NULL,
+    texto TEXT
+);
+"""
+
+_EXTENSOES = {"pdf": ".pdf", "html": ".html", "xml": ".xml", "msword": ".doc", "text/plain": ".txt"}
+
+_RE_SCRIPT = re.compile(r"<(script|style)\b.*?</\1>", re.S | re.I)
+_RE_QUEBRA = re.compile(r"<(br|/p|/div|/tr|/h\d|/li)\b[^>]*>", re.I)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_ESPACOS = re.compile(r"[ \t\r\f\v]+")
+_RE_LINHAS = re.compile(r"\n\s*\n+")
+
+
+def conectar(diretorio: str = DIRETORIO) -> sqlite3.Connection:
+    """Abre (ou cria) o manifesto do diretório de documentos."""
+    os.makedirs(diretorio, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(diretorio, MANIFESTO))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _extensao(content_type: str) -> str:
+    for chave, ext in _EXTENSOES.items():
+        if chave in content_type:
+            return ext
+    return ".bin"
+
+
+def baixar(url: str, diretorio: str) -> Tuple[str, str, str, int]:
+    """
+    Baixa o arquivo em streaming para um temporário, calculando o SHA-256 durante a
+    escrita, e o move para `<diretorio>/<sha[:2]>/<sha><ext>`. Se o conteúdo já
+    existir, o temporário é descartado. Retorna (sha256, arquivo, content_type, tamanho).
+    """
+    sha = hashlib.sha256()
+    tamanho = 0
+    with camara_client.abrir_documento(url) as resp:
+        content_type = resp.headers.get("Content-Type", "").lower()
+        fd, temporario = tempfile.mkstemp(dir=diretorio, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for bloco in resp.iter_content(CHUNK_SIZE):
+                    sha.update(bloco)
+                    f.write(bloco)
+                    tamanho += len(bloco)
+        except BaseException:
+            os.remove(temporario)
+            raise
+
+    digest = sha.hexdigest()
+    if content_type.startswith("application/octet-stream") or not content_type:
+        with open(temporario, "rb") as f:
+            if f.read(5) == b"%PDF-":
+                content_type = "application/pdf"
+    arquivo = os.path.join(diretorio, digest[:2], digest + _extensao(content_type))
+    if os.path.exists(arquivo):
+        os.remove(temporario)
+    else:
+        os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+        os.replace(temporario, arquivo)
+    return digest, arquivo, content_type, tamanho
+
+
+def _texto_html(conteudo: bytes, content_type: str) -> str:
+    charset = re.search(r"charset=([\w-]+)", content_type)
+    try:
+        texto = conteudo.decode(charset.group(1) if charset else "utf-8")
+    except (LookupError, UnicodeDecodeError):
+        texto = conteudo.decode("latin-1")
+    texto = _RE_SCRIPT.sub(" ", texto)
+    texto = _RE_QUEBRA.sub("\n", texto)
+    texto = html.unescape(_RE_TAG.sub(" ", texto))
+    texto = _RE_ESPACOS.sub(" ", texto)
+    return _RE_LINHAS.sub("\n\n", texto).strip()
+
+
+def extrair_texto(arquivo: str, content_type: str = "") -> Optional[str]:
+    """
+    Extrai o texto de um PDF (via pypdf) ou HTML/texto. Retorna None se o formato
+    não for suportado ou se o pypdf não estiver instalado. Roda em processos filhos.
+    """
+    with open(arquivo, "rb") as f:
+        conteudo = f.read()
+
+    if conteudo.startswith(b"%PDF-") or "pdf" in content_type:
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            return None
+        import io
+        leitor = PdfReader(io.BytesIO(conteudo))
+        return "\n".join((pagina.extract_text() or "") for pagina in leitor.pages).strip()
+
+    if "html" in content_type or "xml" in content_type or "text" in content_type:
+        return _texto_html(conteudo, content_type)
+    return None
+
+
+def _extrair(sha: str, arquivo: str, content_type: str) -> Tuple[str, Optional[str]]:
+    return sha, extrair_texto(arquivo, content_type)
+
+
+def _url_inteiro_teor(id_prop: int) -> Optional[str]:
+    # A listagem de proposições não traz o campo: só o detalhe individual
+    return camara_client.obter_proposicao(id_prop).get("urlInteiroTeor") or None
+
+
+def _urls_conhecidas(conn: sqlite3.Connection) -> Dict[int, Optional[str]]:
+    """URLs já resolvidas; ausências antigas (DIAS_RECHECAR_SEM_URL) ficam de fora para nova consulta."""
+    limite = (datetime.now() - timedelta(days=DIAS_RECHECAR_SEM_URL)).isoformat(timespec="seconds")
+    return {
+        id_prop: url
+        for id_prop, url in conn.execute(
+            "SELECT id_proposicao, url FROM urls WHERE url IS NOT NULL OR resolvido_em >= ?", (limite,)
+        )
+    }
+
+
+def _pendentes_extracao(conn: sqlite3.Connection) -> List[Tuple[str, str, str]]:
+    """Conteúdos já baixados cujo texto ainda não foi extraído (ex.: execução interrompida)."""
+    return conn.execute("SELECT sha256, arquivo, content_type FROM conteudos WHERE texto IS NULL").fetchall()
+
+
+def baixar_documentos(
+    ids_proposicao: Iterable[int],
+    diretorio: str = DIRETORIO,
+    max_workers: int = MAX_WORKERS,
+    processos: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Baixa e extrai o inteiro teor das proposições ainda não armazenadas.
+    Retorna (documentos baixados, textos extraídos) nesta execução.
+    """
+    conn = conectar(diretorio)
+    try:
+        ja_baixados = {row[0] for row in conn.execute("SELECT id_proposicao FROM documentos")}
+        pendentes = [i for i in dict.fromkeys(int(i) for i in ids_proposicao) if i not in ja_baixados]
+        urls = _urls_conhecidas(conn)
+        a_resolver = [i for i in pendentes if i not in urls]
+        sem_url = sum(1 for i in pendentes if i in urls and urls[i] is None)
+        print(f"📄 {len(ja_baixados)} documentos já armazenados, {len(pendentes)} proposições pendentes "
+              f"({len(a_resolver)} URLs a resolver, {sem_url} sem inteiro teor)")
+
+        conhecidos: Set[str] = {row[0] for row in conn.execute("SELECT sha256 FROM conteudos")}
+        baixados = extraidos = falhas = 0
+        # Resolução de URLs e downloads em pools separados: um download começa assim que
+        # a sua URL chega, sem esperar a fila de resoluções
+        resolucao = camara_client.criar_executor(max_workers, camara_client.LOTE)
+        downloads = camara_client.criar_executor(max_workers, camara_client.LOTE)
+        extracao = ProcessPoolExecutor(max_workers=processos)
+        em_andamento: Dict[Future, Tuple[str, Any]] = {}
+
+        def extrair(sha: str, arquivo: str, content_type: str) -> None:
+            nonlocal extracao
+            try:
+                futuro = extracao.submit(_extrair, sha, arquivo, content_type)
+            except BrokenProcessPool:
+                # Um processo filho morreu: as extrações seguintes vão para um pool novo
+                extracao.shutdown(wait=False, cancel_futures=True)
+                extracao = ProcessPoolExecutor(max_workers=processos)
+                futuro = extracao.submit(_extrair, sha, arquivo, content_type)
+            em_andamento[futuro] = ("texto", sha)
+
+        try:
+            for sha, arquivo, content_type in _pendentes_extracao(conn):
+                extrair(sha, arquivo, content_type or "")
+            for id_prop in pendentes:
+                if urls.get(id_prop):
+                    em_andamento[downloads.submit(baixar, urls[id_prop], diretorio)] = ("download", id_prop)
+            for id_prop in a_resolver:
+                em_andamento[resolucao.submit(_url_inteiro_teor, id_prop)] = ("url", id_prop)
+
+            # Downloads e extrações terminam em qualquer ordem; as escritas ficam nesta thread (sqlite)
+            while em_andamento:
+                prontos, _ = wait(em_andamento, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    tipo, chave = em_andamento.pop(futuro)
+                    try:
+                        resultado = futuro.result()
+                    except (camara_client.CamaraAPIError, OSError, ValueError) as e:
+                        falhas += 1
+                        print(f"   ⚠️ {'Conteúdo' if tipo == 'texto' else 'Proposição'} {chave}: {e}")
+                        continue
+                    except Exception as e:
+                        if tipo != "texto":
+                            raise
+                        # PDF malformado (PdfReadError, KeyError...) ou processo filho morto:
+                        # o texto fica pendente e é tentado de novo na próxima execução
+                        falhas += 1
+                        print(f"   ⚠️ Conteúdo {chave}: {type(e).__name__}: {e}")
+                        continue
+
+                    if tipo == "url":
+                        urls[chave] = resultado
+                        conn.execute(
+                            "INSERT OR REPLACE INTO urls (id_proposicao, url, resolvido_em) VALUES (?, ?, ?)",
+                            (chave, resultado, datetime.now().isoformat(timespec="seconds")),
+                        )
+                        if resultado:
+                            em_andamento[downloads.submit(baixar, resultado, diretorio)] = ("download", chave)
+                    elif tipo == "download":
+                        sha, arquivo, content_type, tamanho = resultado
+                        conn.execute(
+                            """INSERT OR REPLACE INTO documentos (id_proposicao, url, sha256, baixado_em)
+                               VALUES (?, ?, ?, ?)""",
+                            (chave, urls[chave], sha, datetime.now().isoformat(timespec="seconds")),
+                        )
+                        if sha not in conhecidos:
+                            # Conteúdo inédito: registra e extrai uma única vez por hash
+                            conhecidos.add(sha)
+                            conn.execute(
+                                "INSERT INTO conteudos (sha256, arquivo, content_type, tamanho) VALUES (?, ?, ?, ?)",
+                                (sha, arquivo, content_type, tamanho),
+                            )
+                            extrair(sha, arquivo, content_type)
+                        baixados += 1
+                    else:
+                        sha, texto = resultado
+                        if texto is not None:
+                            conn.execute("UPDATE conteudos SET texto = ? WHERE sha256 = ?", (texto, sha))
+                            extraidos += 1
+                    conn.commit()
+                    if tipo == "download" and baixados % 100 == 0:
+                        print(f"   📊 {baixados} baixados, {extraidos} textos extraídos")
+        finally:
+            # Em caso de interrupção, não espera o que ainda está na fila
+            resolucao.shutdown(wait=False, cancel_futures=True)
+            downloads.shutdown(wait=False, cancel_futures=True)
+            extracao.shutdown(wait=False, cancel_futures=True)
+            conn.commit()
+
+        print(f"✅ {baixados} documentos baixados, {extraidos} textos extraídos"
+              + (f" ({falhas} falhas, execute novamente para retomar)" if falhas else ""))
+        return baixados, extraidos
+    finally:
+        conn.close()
+
+
+def texto_proposicao(id_proposicao: int, diretorio: str = DIRETORIO) -> Optional[str]:
+    """Texto extraído do inteiro teor de uma proposição já baixada."""
+    conn = conectar(diretorio)
+    try:
+        row = conn.execute(
+            """SELECT c.texto FROM documentos d JOIN conteudos c ON c.sha256 = d.sha256
+               WHERE d.id_proposicao = ?""",
+            (id_proposicao,),
+        ).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+def ids_do_ano(ano: int, sigla_tipo: Optional[str] = None) -> List[int]:
+    """Ids das proposições apresentadas no ano (opcionalmente de um tipo, ex.: PL)."""
+    params = {
+        "dataApresentacaoInicio": f"{ano}-01-01",
+        "dataApresentacaoFim": f"{ano}-12-31",
+        "ordem": "ASC",
+        "ordenarPor": "id",
+    }
+    if sigla_tipo:
+        params["siglaTipo"] = sigla_tipo
+    with camara_client.prioridade(camara_client.LOTE):
+        return [p["id"] for p in camara_client.iter_proposicoes(params, max_pages=MAX_PAGES_LISTAGEM, prefetch=True)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download em massa do inteiro teor das proposições")
+    parser.add_argument("ano", type=int, help="ano de apresentação das proposições")
+    parser.add_argument("--tipo", help="sigla do tipo (ex.: PL, PEC)")
+    parser.add_argument("--dir", default=DIRETORIO, help="diretório de destino")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="downloads simultâneos")
+    parser.add_argument("--processos", type=int, help="processos de extração de texto (padrão: nº de CPUs)")
+    args = parser.parse_args()
+
+    try:
+        baixar_documentos(ids_do_ano(args.ano, args.tipo), args.dir, args.workers, args.processos)
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Download interrompido. Execute novamente para retomar de onde parou.")
@@ -0,0 +1,207 @@
+# camara_grafo.py - Grafo de coautoria e temas de proposições em formato CSR
+
+# Coleta `autores_proposicao` e `temas_proposicao` em paralelo e guarda as relações
+# deputado × proposição e proposição × tema como matrizes esparsas CSR (indptr/indices
+# em NumPy). Vizinhos, contagem de coautorias e temas mais frequentes de um deputado
+# saem de fatias dos arrays, sem chamadas à API. Novas proposições podem ser
+# acrescentadas a qualquer momento; o CSR é reconstruído na próxima consulta.
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import camara_client
+
+_ID_DEPUTADO = re.compile(r"/deputados/(\d+)$")
+
+
+def _csr(origem: np.ndarray, destino: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Monta (indptr, indices) de uma matriz n × m a partir de arestas, sem arestas repetidas."""
+    ordem = np.lexsort((destino, origem))
+    origem, destino = origem[ordem], destino[ordem]
+    if len(origem):
+        unica = np.ones(len(origem), dtype=bool)
+        unica[1:] = (origem[1:] != origem[:-1]) | (destino[1:] != destino[:-1])
+        origem, destino = origem[unica], destino[unica]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(origem, minlength=n), out=indptr[1:])
+    return indptr, destino.astype(np.int32)
+
+
+class _Relacao:
+    """Arestas origem → destino acumuladas em buffers, com CSR direto e transposto sob demanda."""
+
+    def __init__(self):
+        self._origem: List[np.ndarray] = []
+        self._destino: List[np.ndarray] = []
+        self._csr: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._csr_t: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def acrescentar(self, origem: Sequence[int], destino: Sequence[int]) -> None:
+        if len(origem):
+            self._origem.append(np.asarray(origem, dtype=np.int32))
+            self._destino.append(np.asarray(destino, dtype=np.int32))
+            self._csr = self._csr_t = None
+
+    def arestas(self) -> Tuple[np.ndarray, np.ndarray]:
+        if len(self._origem) > 1:
+            # Compacta os buffers para que apêndices sucessivos não se acumulem
+            self._origem = [np.concatenate(self._origem)]
+            self._destino = [np.concatenate(self._destino)]
+        if not self._origem:
+            vazio = np.zeros(0, dtype=np.int32)
+            return vazio, vazio
+        return self._origem[0], self._destino[0]
+
+    def direta(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self._csr is None or len(self._csr[0]) != n + 1:
+            origem, destino = self.arestas()
+            self._csr = _csr(origem, destino, n)
+        return self._csr
+
+    def transposta(self, m: int) -> Tuple[np.ndarray, np.ndarray]:
+        if self._csr_t is None or len(self._csr_t[0]) != m + 1:
+            origem, destino = self.arestas()
+            self._csr_t = _csr(destino, origem, m)
+        return self._csr_t
+
+
+def _vizinhos(csr: Tuple[np.ndarray, np.ndarray], i: int) -> np.ndarray:
+    indptr, indices = csr
+    return indices[indptr[i]:indptr[i + 1]]
+
+
+class GrafoProposicoes:
+    """Relações deputado × proposição (autoria) e proposição × tema em CSR."""
+
+    def __init__(self):
+        self.deputados: List[int] = []
+        self.proposicoes: List[int] = []
+        self.temas: List[int] = []
+        self.nomes_temas: Dict[int, str] = {}
+        self._idx_deputado: Dict[int, int] = {}
+        self._idx_proposicao: Dict[int, int] = {}
+        self._idx_tema: Dict[int, int] = {}
+        self._autoria = _Relacao()  # deputado → proposição
+        self._tematica = _Relacao()  # proposição → tema
+
+    @staticmethod
+    def _indice(valor: int, lista: List[int], mapa: Dict[int, int]) -> int:
+        if valor not in mapa:
+            mapa[valor] = len(lista)
+            lista.append(valor)
+        return mapa[valor]
+
+    # ---------- carga ----------
+
+    def adicionar(self, ids_proposicao: Iterable[int], max_workers: int = camara_client.MAX_WORKERS) -> int:
+        """Coleta autores e temas das proposições ainda não vistas. Retorna quantas foram adicionadas."""
+        novas = [p for p in dict.fromkeys(int(i) for i in ids_proposicao) if p not in self._idx_proposicao]
+
+        def buscar(id_prop: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            return camara_client.autores_proposicao(id_prop), camara_client.temas_proposicao(id_prop)
+
+        with camara_client.criar_executor(max_workers, camara_client.LOTE) as executor:
+            resultados = list(executor.map(buscar, novas))
+
+        autoria: Tuple[List[int], List[int]] = ([], [])
+        tematica: Tuple[List[int], List[int]] = ([], [])
+        for id_prop, (autores, temas) in zip(novas, resultados):
+            p = self._indice(id_prop, self.proposicoes, self._idx_proposicao)
+            for autor in autores:
+                # Só autores deputados têm id na uri (.../deputados/{id})
+                m = _ID_DEPUTADO.search(autor.get("uri") or "")
+                if m:
+                    autoria[0].append(self._indice(int(m.group(1)), self.deputados, self._idx_deputado))
+                    autoria[1].append(p)
+            for tema in temas:
+                cod = tema.get("codTema")
+                if cod is None:
+                    continue
+                self.nomes_temas[cod] = tema.get("tema", "")
+                tematica[0].append(p)
+                tematica[1].append(self._indice(cod, self.temas, self._idx_tema))
+
+        self._autoria.acrescentar(*autoria)
+        self._tematica.acrescentar(*tematica)
+        return len(novas)
+
+    # ---------- CSR ----------
+
+    def _dep_prop(self):
+        return self._autoria.direta(len(self.deputados))
+
+    def _prop_dep(self):
+        return self._autoria.transposta(len(self.proposicoes))
+
+    def _prop_tema(self):
+        return self._tematica.direta(len(self.proposicoes))
+
+    # ---------- consultas ----------
+
+    def autores(self, id_prop: int) -> List[int]:
+        return [self.deputados[i] for i in _vizinhos(self._prop_dep(), self._idx_proposicao[id_prop])]
+
+    def proposicoes_de(self, id_deputado: int) -> List[int]:
+        return [self.proposicoes[i] for i in _vizinhos(self._dep_prop(), self._idx_deputado[id_deputado])]
+
+    def temas_de(self, id_prop: int) -> List[int]:
+        return [self.temas[i] for i in _vizinhos(self._prop_tema(), self._idx_proposicao[id_prop])]
+
+    def coautores(self, id_deputado: int, n: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Coautores do deputado com o número de proposições em comum, do maior para o menor."""
+        d = self._idx_deputado[id_deputado]
+        indptr, indices = self._prop_dep()
+        props = _vizinhos(self._dep_prop(), d)
+        if not len(props):
+            return []
+        vizinhos = np.concatenate([indices[indptr[p]:indptr[p + 1]] for p in props])
+        contagem = np.bincount(vizinhos, minlength=len(self.deputados))
+        contagem[d] = 0
+        ordem = np.flatnonzero(contagem)
+        ordem = ordem[np.argsort(-contagem[ordem], kind="stable")][:n]
+        return [(self.deputados[i], int(contagem[i])) for i in ordem]
+
+    def top_temas(self, id_deputado: int, n: int = 5) -> List[Tuple[int, str, int]]:
+        """Temas mais frequentes nas proposições do deputado: (codTema, tema, quantidade)."""
+        indptr, indices = self._prop_tema()
+        props = _vizinhos(self._dep_prop(), self._idx_deputado[id_deputado])
+        if not len(props):
+            return []
+        temas = np.concatenate([indices[indptr[p]:indptr[p + 1]] for p in props])
+        contagem = np.bincount(temas, minlength=len(self.temas))
+        ordem = np.flatnonzero(contagem)
+        ordem = ordem[np.argsort(-contagem[ordem], kind="stable")][:n]
+        return [(self.temas[i], self.nomes_temas.get(self.temas[i], ""), int(contagem[i])) for i in ordem]
+
+    # ---------- persistência ----------
+
+    def salvar(self, caminho: str) -> None:
+        """Grava ids, arestas e nomes de temas em um .npz."""
+        autoria = self._autoria.arestas()
+        tematica = self._tematica.arestas()
+        np.savez_compressed(
+            caminho,
+            deputados=np.asarray(self.deputados, dtype=np.int64),
+            proposicoes=np.asarray(self.proposicoes, dtype=np.int64),
+            temas=np.asarray(self.temas, dtype=np.int64),
+            nomes_temas=np.asarray([self.nomes_temas.get(t, "") for t in self.temas], dtype=str),
+            autoria_origem=autoria[0], autoria_destino=autoria[1],
+            tematica_origem=tematica[0], tematica_destino=tematica[1],
+        )
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "GrafoProposicoes":
+        dados = np.load(caminho)
+        grafo = cls()
+        grafo.deputados = dados["deputados"].tolist()
+        grafo.proposicoes = dados["proposicoes"].tolist()
+        grafo.temas = dados["temas"].tolist()
+        grafo.nomes_temas = dict(zip(grafo.temas, dados["nomes_temas"].tolist()))
+        grafo._idx_deputado = {v: i for i, v in enumerate(grafo.deputados)}
+        grafo._idx_proposicao = {v: i for i, v in enumerate(grafo.proposicoes)}
+        grafo._idx_tema = {v: i for i, v in enumerate(grafo.temas)}
+        grafo._autoria.acrescentar(dados["autoria_origem"], dados["autoria_destino"])
+        grafo._tematica.acrescentar(dados["tematica_origem"], dados["tematica_destino"])
+        return grafo
@@ -0,0 +1,260 @@
+# camara_membros.py - Índice local de composição de órgãos, frentes, blocos e partidos
+
+# Responde "quem fazia parte do grupo X na data D" e "de quais grupos o deputado Y
+# fazia parte na data D" sem chamar a API. Cada vínculo é um intervalo [início, fim]
+# guardado em arrays compactos (datas como ordinais), com um índice por grupo
+# ordenado pelo início e um índice invertido deputado → vínculos.
+#
+# Os dados vêm de deputados_orgao, membros_frente, membros_bloco e membros_partido.
+# Quando a API não informa datas (frentes, blocos, partidos), o vínculo começa na
+# primeira atualização que o viu e é encerrado na atualização em que deixa de aparecer.
+# Quando informa (órgãos), os intervalos recebidos atualizam os conhecidos e um
+# vínculo aberto ausente da resposta também é encerrado, sem apagar o histórico.
+
+import json
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import camara_client
+
+ORGAO = "orgao"
+FRENTE = "frente"
+BLOCO = "bloco"
+PARTIDO = "partido"
+
+# Fim de um vínculo ainda em vigor
+ABERTO = date.max.toordinal()
+MAX_PAGES_MEMBROS = 20
+
+Grupo = Tuple[str, int]
+
+_FONTES: Dict[str, Callable[[int], Iterator[Dict[str, Any]]]] = {
+    ORGAO: lambda id_: camara_client.iter_deputados_orgao(id_, max_pages=MAX_PAGES_MEMBROS),
+    FRENTE: lambda id_: camara_client.iter_membros_frente(id_, max_pages=MAX_PAGES_MEMBROS),
+    BLOCO: lambda id_: camara_client.iter_membros_bloco(id_, max_pages=MAX_PAGES_MEMBROS),
+    PARTIDO: lambda id_: camara_client.iter_membros_partido(id_, max_pages=MAX_PAGES_MEMBROS),
+}
+
+
+def _ordinal(valor: Optional[str], padrao: int) -> int:
+    if not valor:
+        return padrao
+    return date.fromisoformat(str(valor)[:10]).toordinal()
+
+
+class _Indices:
+    """Índices imutáveis montados a partir das colunas; trocados atomicamente a cada atualização."""
+    __slots__ = ("grupos", "deputado", "grupo", "inicio", "fim", "por_grupo", "por_deputado")
+
+    def __init__(self, grupos: List[Grupo], deputado: array, grupo: array, inicio: array, fim: array):
+        # As colunas não são mais alteradas depois de indexadas (cada atualização cria novas)
+        self.grupos = tuple(grupos)
+        self.deputado, self.grupo, self.inicio, self.fim = deputado, grupo, inicio, fim
+        linhas_grupo: Dict[int, List[int]] = {}
+        linhas_deputado: Dict[int, List[int]] = {}
+        for linha in range(len(deputado)):
+            linhas_grupo.setdefault(grupo[linha], []).append(linha)
+            linhas_deputado.setdefault(deputado[linha], []).append(linha)
+
+        # Por grupo: linhas ordenadas pelo início + inícios para busca binária
+        self.por_grupo: Dict[Grupo, Tuple[array, array]] = {}
+        for g, linhas in linhas_grupo.items():
+            linhas.sort(key=lambda l: inicio[l])
+            self.por_grupo[grupos[g]] = (array("l", (inicio[l] for l in linhas)), array("l", linhas))
+        self.por_deputado: Dict[int, array] = {d: array("l", ls) for d, ls in linhas_deputado.items()}
+
+
+class IndiceMembros:
+    """Vínculos deputado ↔ grupo com intervalos de vigência, consultáveis localmente."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._grupos: List[Grupo] = []
+        self._posicao_grupo: Dict[Grupo, int] = {}
+        # Colunas dos vínculos (uma linha por intervalo)
+        self._deputado = array("l")
+        self._grupo = array("l")
+        self._inicio = array("l")
+        self._fim = array("l")
+        self._indices = _Indices([], self._deputado, self._grupo, self._inicio, self._fim)
+        self.nomes: Dict[int, str] = {}
+        self.atualizado_em: Optional[float] = None
+        self._timer: Optional[threading.Timer] = None
+
+    # ---------- atualização ----------
+
+    def _id_grupo(self, grupo: Grupo) -> int:
+        if grupo not in self._posicao_grupo:
+            self._posicao_grupo[grupo] = len(self._grupos)
+            self._grupos.append(grupo)
+        return self._posicao_grupo[grupo]
+
+    def _mesclar(self, atuais: List[Tuple[int, int, int]], membros: List[Dict[str, Any]], hoje: int) -> List[Tuple[int, int, int]]:
+        """Combina os vínculos (deputado, início, fim) conhecidos de um grupo com a composição atual."""
+        if any(m.get("dataInicio") for m in membros):
+            # A API informa os intervalos: cada um atualiza o vínculo com o mesmo início.
+            # Vínculos abertos que sumiram da resposta são encerrados; os já encerrados ficam
+            recebidos = {(m["id"], _ordinal(m.get("dataInicio"), hoje)): _ordinal(m.get("dataFim"), ABERTO) for m in membros}
+            abertos_recebidos = {dep for (dep, _), fim in recebidos.items() if fim == ABERTO}
+            novas = []
+            for dep, ini, fim in atuais:
+                if (dep, ini) in recebidos:
+                    continue
+                if fim == ABERTO:
+                    if dep in abertos_recebidos:
+                        continue  # substituído por um vínculo aberto com outro início
+                    fim = max(ini, hoje - 1)
+                novas.append((dep, ini, fim))
+            novas.extend((dep, ini, fim) for (dep, ini), fim in recebidos.items())
+            return novas
+
+        presentes = {m["id"] for m in membros}
+        abertos = set()
+        novas = []
+        for dep, ini, fim in atuais:
+            if fim == ABERTO and dep not in presentes:
+                fim = max(ini, hoje - 1)  # saiu do grupo desde a última atualização
+            if fim == ABERTO:
+                abertos.add(dep)
+            novas.append((dep, ini, fim))
+        novas.extend((dep, hoje, ABERTO) for dep in presentes - abertos)
+        return novas
+
+    def atualizar(self, grupos: Iterable[Grupo], max_workers: int = camara_client.MAX_WORKERS) -> None:
+        """Busca a composição atual dos grupos em paralelo e reconstrói os índices."""
+        grupos = list(dict.fromkeys(grupos))
+
+        def buscar(grupo: Grupo) -> List[Dict[str, Any]]:
+            tipo, id_ = grupo
+            return list(_FONTES[tipo](id_))
+
+        with camara_client.criar_executor(max_workers, camara_client.LOTE) as executor:
+            resultados = list(executor.map(buscar, grupos))
+
+        hoje = date.today().toordinal()
+        with self._lock:
+            por_grupo: Dict[int, List[Tuple[int, int, int]]] = {}
+            for l in range(len(self._deputado)):
+                por_grupo.setdefault(self._grupo[l], []).append((self._deputado[l], self._inicio[l], self._fim[l]))
+
+            for grupo, membros in zip(grupos, resultados):
+                membros = [m for m in membros if m.get("id") is not None]
+                for m in membros:
+                    if m.get("nome"):
+                        self.nomes[m["id"]] = m["nome"]
+                g = self._id_grupo(grupo)
+                por_grupo[g] = self._mesclar(por_grupo.get(g, []), membros, hoje)
+
+            # Colunas novas a cada atualização: consultas em andamento seguem com os índices anteriores
+            deputado, grupo_col, inicio, fim = array("l"), array("l"), array("l"), array("l")
+            for g, vinculos in por_grupo.items():
+                for dep, ini, f in vinculos:
+                    deputado.append(dep)
+                    grupo_col.append(g)
+                    inicio.append(ini)
+                    fim.append(f)
+            self._deputado, self._grupo, self._inicio, self._fim = deputado, grupo_col, inicio, fim
+            self._indices = _Indices(self._grupos, deputado, grupo_col, inicio, fim)
+            self.atualizado_em = time.time()
+
+    def atualizar_se_necessario(self, grupos: Iterable[Grupo], intervalo_s: float = 24 * 3600) -> bool:
+        if self.atualizado_em is not None and time.time() - self.atualizado_em < intervalo_s:
+            return False
+        self.atualizar(grupos)
+        return True
+
+    def iniciar_atualizacao_periodica(self, grupos: Iterable[Grupo], intervalo_s: float = 24 * 3600) -> None:
+        """Atualiza agora e depois a cada `intervalo_s` segundos, em uma thread daemon."""
+        grupos = list(grupos)
+
+        def ciclo():
+            try:
+                self.atualizar(grupos)
+            except camara_client.CamaraAPIError as e:
+                print(f"⚠️ Falha ao atualizar composição dos grupos: {e}")
+            self._timer = threading.Timer(intervalo_s, ciclo)
+            self._timer.daemon = True
+            self._timer.start()
+
+        ciclo()
+
+    def parar_atualizacao_periodica(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    # ---------- consultas ----------
+
+    def membros_em(self, tipo: str, id_grupo: int, data: Optional[date] = None) -> List[int]:
+        """Deputados que pertenciam ao grupo na data (padrão: hoje)."""
+        d = (data or date.today()).toordinal()
+        idx = self._indices
+        entrada = idx.por_grupo.get((tipo, id_grupo))
+        if entrada is None:
+            return []
+        inicios, linhas = entrada
+        fim, deputado = idx.fim, idx.deputado
+        return [deputado[l] for l in linhas[:bisect_right(inicios, d)] if fim[l] >= d]
+
+    def grupos_de(self, id_deputado: int, data: Optional[date] = None, tipo: Optional[str] = None) -> List[Grupo]:
+        """Grupos (tipo, id) de que o deputado fazia parte na data (padrão: hoje)."""
+        d = (data or date.today()).toordinal()
+        idx = self._indices
+        resultado = []
+        for l in idx.por_deputado.get(id_deputado, ()):
+            if idx.inicio[l] <= d <= idx.fim[l]:
+                grupo = idx.grupos[idx.grupo[l]]
+                if tipo is None or grupo[0] == tipo:
+                    resultado.append(grupo)
+        return resultado
+
+    def historico(self, id_deputado: int) -> List[Tuple[Grupo, date, Optional[date]]]:
+        """Todos os vínculos do deputado como (grupo, início, fim ou None se em vigor)."""
+        idx = self._indices
+        return [
+            (idx.grupos[idx.grupo[l]], date.fromordinal(idx.inicio[l]),
+             None if idx.fim[l] == ABERTO else date.fromordinal(idx.fim[l]))
+            for l in idx.por_deputado.get(id_deputado, ())
+        ]
+
+    # ---------- persistência ----------
+
+    def salvar(self, caminho: str) -> None:
+        """Grava os vínculos para preservar o histórico entre execuções."""
+        with self._lock:
+            dados = {
+                "grupos": self._grupos,
+                "deputado": self._deputado.tolist(),
+                "grupo": self._grupo.tolist(),
+                "inicio": self._inicio.tolist(),
+                "fim": self._fim.tolist(),
+                "nomes": {str(k): v for k, v in self.nomes.items()},
+                "atualizado_em": self.atualizado_em,
+            }
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(dados, f, ensure_ascii=False)
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "IndiceMembros":
+        with open(caminho, encoding="utf-8") as f:
+            dados = json.load(f)
+        indice = cls()
+        indice._grupos = [tuple(g) for g in dados["grupos"]]
+        indice._posicao_grupo = {g: i for i, g in enumerate(indice._grupos)}
+        indice._deputado = array("l", dados["deputado"])
+        indice._grupo = array("l", dados["grupo"])
+        indice._inicio = array("l", dados["inicio"])
+        indice._fim = array("l", dados["fim"])
+        indice.nomes = {int(k): v for k, v in dados.get("nomes", {}).items()}
+        indice.atualizado_em = dados.get("atualizado_em")
+        indice._indices = _Indices(indice._grupos, indice._deputado, indice._grupo, indice._inicio, indice._fim)
+        return indice
+
+
+def todos_os_partidos() -> List[Grupo]:
+    """Grupos de todos os partidos atuais, para usar em `IndiceMembros.atualizar`."""
+    return [(PARTIDO, p["id"]) for p in camara_client.iter_partidos(max_pages=MAX_PAGES_MEMBROS)]
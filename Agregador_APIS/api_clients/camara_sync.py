@@ -0,0 +1,183 @@
+# camara_sync.py - Sincronização incremental da Câmara em SQLite
+
+# Mantém uma cópia local de proposições e tramitações. Cada execução busca apenas
+# o que tramitou desde o último checkpoint (high-water mark por endpoint) e faz
+# upsert no banco, em vez de repetir o crawl completo.
+#
+# Uso: python camara_sync.py [--db camara.sqlite3] [--desde AAAA-MM-DD] [--workers 4]
+
+import argparse
+import json
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import camara_client
+
+DB_PATH = "camara.sqlite3"
+
+# Sem checkpoint, começa pelo mesmo intervalo padrão da API (últimos 30 dias)
+DIAS_INICIAIS = 30
+SYNC_MAX_PAGES = 200
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    endpoint TEXT PRIMARY KEY,
+    high_water TEXT NOT NULL,
+    atualizado_em TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS proposicoes (
+    id INTEGER PRIMARY KEY,
+    sigla_tipo TEXT,
+    numero INTEGER,
+    ano INTEGER,
+    ementa TEXT,
+    ultima_tramitacao TEXT,
+    dados TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_proposicoes_ultima_tramitacao ON proposicoes(ultima_tramitacao);
+CREATE TABLE IF NOT EXISTS tramitacoes (
+    id_proposicao INTEGER NOT NULL,
+    sequencia INTEGER NOT NULL,
+    data_hora TEXT,
+    dados TEXT NOT NULL,
+    PRIMARY KEY (id_proposicao, sequencia)
+);
+CREATE INDEX IF NOT EXISTS idx_tramitacoes_data_hora ON tramitacoes(data_hora);
+"""
+
+
+def conectar(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """Abre o banco local e garante o esquema."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def ler_checkpoint(conn: sqlite3.Connection, endpoint: str) -> Optional[str]:
+    row = conn.execute("SELECT high_water FROM checkpoints WHERE endpoint = ?", (endpoint,)).fetchone()
+    return row[0] if row else None
+
+
+def gravar_checkpoint(conn: sqlite3.Connection, endpoint: str, high_water: str) -> None:
+    conn.execute(
+        """INSERT INTO checkpoints (endpoint, high_water, atualizado_em) VALUES (?, ?, ?)
+           ON CONFLICT(endpoint) DO UPDATE SET high_water = excluded.high_water,
+                                               atualizado_em = excluded.atualizado_em""",
+        (endpoint, high_water, datetime.now().isoformat(timespec="seconds")),
+    )
+
+
+def _upsert_proposicoes(conn: sqlite3.Connection, proposicoes: List[Dict[str, Any]]) -> None:
+    conn.executemany(
+        """INSERT INTO proposicoes (id, sigla_tipo, numero, ano, ementa, dados) VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(id) DO UPDATE SET sigla_tipo = excluded.sigla_tipo, numero = excluded.numero,
+                                         ano = excluded.ano, ementa = excluded.ementa, dados = excluded.dados""",
+        [
+            (p["id"], p.get("siglaTipo"), p.get("numero"), p.get("ano"), p.get("ementa"),
+             json.dumps(p, ensure_ascii=False))
+            for p in proposicoes
+        ],
+    )
+
+
+def _upsert_tramitacoes(conn: sqlite3.Connection, id_prop: int, tramitacoes: List[Dict[str, Any]]) -> Optional[str]:
+    """Grava as tramitações de uma proposição e retorna o maior `dataHora` visto."""
+    conn.executemany(
+        """INSERT INTO tramitacoes (id_proposicao, sequencia, data_hora, dados) VALUES (?, ?, ?, ?)
+           ON CONFLICT(id_proposicao, sequencia) DO UPDATE SET data_hora = excluded.data_hora,
+                                                               dados = excluded.dados""",
+        [
+            (id_prop, t.get("sequencia"), t.get("dataHora"), json.dumps(t, ensure_ascii=False))
+            for t in tramitacoes
+            if t.get("sequencia") is not None
+        ],
+    )
+    ultima = max((t["dataHora"] for t in tramitacoes if t.get("dataHora")), default=None)
+    if ultima:
+        conn.execute(
+            """UPDATE proposicoes SET ultima_tramitacao = ?
+               WHERE id = ? AND (ultima_tramitacao IS NULL OR ultima_tramitacao < ?)""",
+            (ultima, id_prop, ultima),
+        )
+    return ultima
+
+
+def sincronizar(
+    db_path: str = DB_PATH,
+    desde: Optional[str] = None,
+    max_workers: int = camara_client.MAX_WORKERS,
+) -> Tuple[int, int]:
+    """
+    Sincroniza proposições e tramitações desde o último checkpoint (ou `desde`, AAAA-MM-DD).
+    Retorna (proposições atualizadas, tramitações gravadas).
+    """
+    conn = conectar(db_path)
+    try:
+        high_water = desde or ler_checkpoint(conn, "tramitacoes")
+        if high_water is None:
+            high_water = (date.today() - timedelta(days=DIAS_INICIAIS)).isoformat()
+        # A API filtra por dia: refaz o dia do checkpoint e deixa o upsert descartar repetições
+        data_inicio = high_water[:10]
+        data_fim = date.today().isoformat()
+        print(f"🔄 Sincronizando tramitações de {data_inicio} até {data_fim}...")
+
+        proposicoes: List[Dict[str, Any]] = []
+        truncado = False
+        with camara_client.prioridade(camara_client.LOTE):
+            try:
+                for proposicao in camara_client.iter_proposicoes(
+                    {"dataInicio": data_inicio, "dataFim": data_fim, "ordenarPor": "id"},
+                    max_pages=SYNC_MAX_PAGES,
+                    prefetch=True,
+                    completo=True,
+                ):
+                    proposicoes.append(proposicao)
+            except camara_client.PaginacaoIncompletaError:
+                # O que foi lido é gravado, mas o checkpoint não avança: o restante
+                # do período seria pulado para sempre
+                truncado = True
+        _upsert_proposicoes(conn, proposicoes)
+        ids = [p["id"] for p in proposicoes]
+        print(f"   📄 {len(ids)} proposições com tramitação no período")
+
+        def buscar(id_prop: int) -> List[Dict[str, Any]]:
+            return list(camara_client.iter_tramitacoes_proposicao(
+                id_prop, {"dataInicio": data_inicio, "dataFim": data_fim}, max_pages=SYNC_MAX_PAGES
+            ))
+
+        total = 0
+        novo_high_water = high_water
+        with camara_client.criar_executor(max_workers, camara_client.LOTE) as executor:
+            # As buscas correm em paralelo; as escritas ficam nesta thread (sqlite)
+            for id_prop, tramitacoes in zip(ids, executor.map(buscar, ids)):
+                ultima = _upsert_tramitacoes(conn, id_prop, tramitacoes)
+                total += len(tramitacoes)
+                if ultima and ultima > novo_high_water:
+                    novo_high_water = ultima
+
+        if truncado:
+            conn.commit()
+            print(f"⚠️ {total} tramitações gravadas, mas a listagem passou de {SYNC_MAX_PAGES} páginas. "
+                  f"Checkpoint mantido em {high_water}; aumente SYNC_MAX_PAGES para completar o período.")
+            return len(ids), total
+        gravar_checkpoint(conn, "tramitacoes", novo_high_water)
+        conn.commit()
+        print(f"✅ {total} tramitações gravadas. Checkpoint: {novo_high_water}")
+        return len(ids), total
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sincronização incremental da Câmara em SQLite")
+    parser.add_argument("--db", default=DB_PATH, help="arquivo SQLite de destino")
+    parser.add_argument("--desde", help="força o início da sincronização (AAAA-MM-DD)")
+    parser.add_argument("--workers", type=int, default=camara_client.MAX_WORKERS)
+    args = parser.parse_args()
+
+    try:
+        sincronizar(args.db, desde=args.desde, max_workers=args.workers)
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Sincronização interrompida. Nada foi gravado nesta execução.")
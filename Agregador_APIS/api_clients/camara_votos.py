@@ -0,0 +1,186 @@
+# camara_votos.py - Matriz compacta de votos nominais da Câmara
+
+# Coleta `votos_votacao` em paralelo e monta uma matriz int8 (deputado × votação),
+# salva em .npy (carregável com memory-map) + .json com os mapas id ↔ índice.
+# Consultas de coesão e similaridade rodam vetorizadas sobre a matriz.
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+import camara_client
+
+# Codificação dos votos na matriz (0 = deputado não votou / não estava na votação)
+AUSENTE = 0
+SIM = 1
+NAO = -1
+ABSTENCAO = 2
+OBSTRUCAO = 3
+OUTRO = 4  # Artigo 17 e demais tipos
+
+CODIGOS_VOTO = {
+    "Sim": SIM,
+    "Não": NAO,
+    "Abstenção": ABSTENCAO,
+    "Obstrução": OBSTRUCAO,
+}
+
+
+def codificar_voto(tipo_voto: Optional[str]) -> int:
+    """Converte o `tipoVoto` da API para o código int8 da matriz."""
+    if not tipo_voto:
+        return AUSENTE
+    return CODIGOS_VOTO.get(tipo_voto.strip(), OUTRO)
+
+
+@dataclass
+class MatrizVotos:
+    """Votos nominais em forma de matriz: linhas = deputados, colunas = votações."""
+    votos: np.ndarray
+    deputados: List[int]
+    votacoes: List[str]
+    partidos: Dict[int, str] = field(default_factory=dict)
+    indice_deputado: Dict[int, int] = field(init=False, repr=False)
+    indice_votacao: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.indice_deputado = {d: i for i, d in enumerate(self.deputados)}
+        self.indice_votacao = {v: j for j, v in enumerate(self.votacoes)}
+
+    # ---------- persistência ----------
+
+    def salvar(self, prefixo: str) -> None:
+        """Grava `<prefixo>.npy` (matriz) e `<prefixo>.json` (mapas e partidos)."""
+        np.save(f"{prefixo}.npy", np.ascontiguousarray(self.votos, dtype=np.int8))
+        meta = {
+            "deputados": self.deputados,
+            "votacoes": self.votacoes,
+            "partidos": {str(k): v for k, v in self.partidos.items()},
+        }
+        with open(f"{prefixo}.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    @classmethod
+    def carregar(cls, prefixo: str, mmap: bool = True) -> "MatrizVotos":
+        """Carrega uma matriz salva; com `mmap=True` a matriz não é lida inteira para a memória."""
+        votos = np.load(f"{prefixo}.npy", mmap_mode="r" if mmap else None)
+        with open(f"{prefixo}.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        partidos = {int(k): v for k, v in meta.get("partidos", {}).items()}
+        return cls(votos, [int(d) for d in meta["deputados"]], list(meta["votacoes"]), partidos)
+
+    # ---------- consultas ----------
+
+    def votos_deputado(self, id_deputado: int) -> np.ndarray:
+        return self.votos[self.indice_deputado[id_deputado]]
+
+    def votos_votacao(self, id_votacao: str) -> np.ndarray:
+        return self.votos[:, self.indice_votacao[id_votacao]]
+
+    def membros(self, sigla_partido: str) -> np.ndarray:
+        """Índices das linhas dos deputados de um partido."""
+        return np.array(
+            [self.indice_deputado[d] for d, p in self.partidos.items() if p == sigla_partido],
+            dtype=np.intp,
+        )
+
+    def coesao(self, sigla_partido: str) -> np.ndarray:
+        """
+        Índice de Rice por votação: |sim - não| / (sim + não) entre os membros do partido.
+        Votações em que nenhum membro votou Sim/Não ficam como NaN.
+        """
+        bloco = self.votos[self.membros(sigla_partido)]
+        sim = (bloco == SIM).sum(axis=0)
+        nao = (bloco == NAO).sum(axis=0)
+        total = sim + nao
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(total > 0, np.abs(sim - nao) / total, np.nan)
+
+    def coesao_partidos(self) -> Dict[str, float]:
+        """Coesão média (Rice) de cada partido."""
+        resultado = {}
+        for sigla in sorted(set(self.partidos.values())):
+            indices = self.coesao(sigla)
+            if np.any(~np.isnan(indices)):
+                resultado[sigla] = float(np.nanmean(indices))
+        return resultado
+
+    def similaridade(self, id_deputado: int) -> np.ndarray:
+        """
+        Taxa de concordância (Sim/Não) do deputado com cada linha da matriz,
+        considerando só as votações em que ambos votaram Sim ou Não.
+        """
+        v = self.votos_deputado(id_deputado)
+        decisivo = (v == SIM) | (v == NAO)
+        outros = self.votos[:, decisivo]
+        alvo = v[decisivo]
+        ambos = (outros == SIM) | (outros == NAO)
+        iguais = (outros == alvo) & ambos
+        n = ambos.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(n > 0, iguais.sum(axis=1) / n, np.nan)
+
+    def matriz_similaridade(self) -> np.ndarray:
+        """Concordância Sim/Não entre todos os pares de deputados (deputados × deputados)."""
+        sim = (self.votos == SIM).astype(np.float32)
+        nao = (self.votos == NAO).astype(np.float32)
+        iguais = sim @ sim.T + nao @ nao.T
+        decisivo = sim + nao
+        ambos = decisivo @ decisivo.T
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(ambos > 0, iguais / ambos, np.nan)
+
+    def mais_similares(self, id_deputado: int, n: int = 10) -> List[Tuple[int, float]]:
+        sims = self.similaridade(id_deputado)
+        sims[self.indice_deputado[id_deputado]] = np.nan
+        ordem = np.argsort(np.nan_to_num(sims, nan=-1.0))[::-1][:n]
+        return [(self.deputados[i], float(sims[i])) for i in ordem if not np.isnan(sims[i])]
+
+
+def _buscar_votos(id_votacao: str) -> List[Dict[str, Any]]:
+    # Pelo cache de votações passadas do camara_client, quando ativo (`configurar_cache`)
+    return camara_client.votos_votacao(id_votacao)
+
+
+def construir_matriz(
+    ids_votacao: Iterable[str],
+    max_workers: int = camara_client.MAX_WORKERS,
+) -> MatrizVotos:
+    """Coleta os votos das votações em paralelo e monta a matriz int8."""
+    votacoes = list(dict.fromkeys(str(v) for v in ids_votacao))
+    indice_deputado: Dict[int, int] = {}
+    partidos: Dict[int, str] = {}
+    linhas: List[int] = []
+    colunas: List[int] = []
+    valores: List[int] = []
+
+    with camara_client.criar_executor(max_workers, camara_client.LOTE) as executor:
+        for j, votos in enumerate(executor.map(_buscar_votos, votacoes)):
+            for voto in votos:
+                dep = voto.get("deputado_") or {}
+                id_dep = dep.get("id")
+                if id_dep is None:
+                    continue
+                i = indice_deputado.setdefault(id_dep, len(indice_deputado))
+                if dep.get("siglaPartido"):
+                    partidos[id_dep] = dep["siglaPartido"]
+                linhas.append(i)
+                colunas.append(j)
+                valores.append(codificar_voto(voto.get("tipoVoto")))
+
+    matriz = np.zeros((len(indice_deputado), len(votacoes)), dtype=np.int8)
+    matriz[np.array(linhas, dtype=np.intp), np.array(colunas, dtype=np.intp)] = np.array(valores, dtype=np.int8)
+    return MatrizVotos(matriz, list(indice_deputado), votacoes, partidos)
+
+
+def construir_matriz_periodo(
+    data_inicio: str,
+    data_fim: str,
+    max_workers: int = camara_client.MAX_WORKERS,
+) -> MatrizVotos:
+    """Monta a matriz de todas as votações do período (AAAA-MM-DD)."""
+    with camara_client.prioridade(camara_client.LOTE):
+        votacoes = camara_client.listar_votacoes({"dataInicio": data_inicio, "dataFim": data_fim})
+    return construir_matriz([v["id"] for v in votacoes], max_workers=max_workers)
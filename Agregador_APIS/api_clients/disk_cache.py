@@ -0,0 +1,71 @@
+# disk_cache.py - Cache persistente em disco (SQLite)
+
+# Guarda respostas já decodificadas (JSON) por chave. Entradas com TTL expiram;
+# entradas sem TTL (dados históricos que não mudam mais) ficam para sempre.
+
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+import json_codec
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL,
+    expira_em REAL
+);
+"""
+
+
+class DiskCache:
+    """Cache chave → valor JSON em SQLite, seguro para uso entre threads."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Retorna (encontrado, valor). Entradas expiradas contam como ausentes."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT valor, expira_em FROM cache WHERE chave = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return False, None
+        valor, expira_em = row
+        if expira_em is not None and expira_em < time.time():
+            return False, None
+        return True, json_codec.loads(valor)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Grava o valor; `ttl=None` significa permanente."""
+        expira_em = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (chave, valor, expira_em) VALUES (?, ?, ?)",
+                (key, json_codec.dumps(value, ensure_ascii=False), expira_em),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE chave = ?", (key,))
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Remove as entradas expiradas e retorna quantas foram apagadas."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM cache WHERE expira_em IS NOT NULL AND expira_em < ?", (time.time(),)
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -36,6 +36,8 @@ from datetime import datetime, timedelta
 import csv
 from pathlib import Path
 
+from json_codec import decode_response
+
 # ==========================================
 # CONFIGURAÇÕES E CONSTANTES
 # ==========================================
@@ -246,7 +248,7 @@ class IBGEClientCompleto:
             try:
                 response = self.session.get(url, params=params, timeout=TIMEOUT)
                 response.raise_for_status()
-                data = response.json()
+                data = decode_response(response)
 
                 # Salvar no cache
                 if self.cache_enabled:
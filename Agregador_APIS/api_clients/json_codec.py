@@ -0,0 +1,119 @@
+# json_codec.py - Codificação/decodificação JSON com motor plugável
+#
+# Usa orjson quando instalado (pip install orjson) e a biblioteca padrão caso
+# contrário. A variável de ambiente JSON_CODEC=json força a biblioteca padrão.
+#
+# A semântica é a mesma do `json` padrão: `loads` produz os mesmos objetos e
+# `dumps(obj, default=str, ensure_ascii=False)` produz um JSON que decodifica para
+# o mesmo valor (datas, dataclasses e tipos desconhecidos passam por `default`); o
+# texto pode diferir nos espaços. Com `ensure_ascii=True` (padrão, como no json),
+# `dumps` usa a biblioteca padrão. Qualquer entrada que o motor rápido recuse (NaN
+# na leitura, inteiros acima de 64 bits, encoding diferente de UTF-8, BOM) é
+# tratada pela biblioteca padrão. Na escrita, o orjson grava NaN/Infinity como
+# null e membros de Enum pelo valor; payloads de API não contêm nenhum dos dois.
+#
+# Benchmark: python json_codec.py [arquivos.json...]   (padrão: ../resultados/*.json)
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # motor rápido opcional
+    orjson = None
+
+if os.environ.get("JSON_CODEC", "").lower() == "json":
+    orjson = None
+
+ENGINE = "orjson" if orjson is not None else "json"
+
+if orjson is not None:
+    # Datas e dataclasses vão para `default`, como no json padrão (orjson as serializaria sozinho)
+    _OPCOES_ORJSON = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decodifica JSON (bytes UTF-8 ou str)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # a biblioteca padrão decide (e gera o erro, se for inválido)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, ensure_ascii: bool = True) -> str:
+    """
+    Codifica em JSON (str). `default` trata tipos não serializáveis, como em json.dumps.
+    O motor rápido só é usado com `ensure_ascii=False`: o orjson não escapa não-ASCII,
+    e reescapar a saída custa mais que o próprio json.dumps.
+    """
+    if orjson is not None and not ensure_ascii:
+        try:
+            return orjson.dumps(obj, default=default, option=_OPCOES_ORJSON).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # ex.: inteiro acima de 64 bits
+    return json.dumps(obj, default=default, ensure_ascii=ensure_ascii)
+
+
+def decode_response(response: Any) -> Any:
+    """
+    Corpo JSON de uma resposta requests/httpx. Equivale a `response.json()`:
+    o motor rápido só lê os bytes direto quando o encoding é UTF-8; nos demais
+    casos (ou se ele recusar o conteúdo) a decodificação fica com `response.json()`.
+    """
+    if orjson is not None:
+        encoding = (getattr(response, "encoding", None) or "utf-8").lower().replace("_", "-")
+        if encoding in ("utf-8", "utf8"):
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+    return response.json()
+
+
+def _benchmark(caminhos, repeticoes: int = 50) -> None:
+    import glob
+    import time
+
+    if orjson is None:
+        print("⚠️ orjson não está instalado: nada a comparar (pip install orjson)")
+        return
+    arquivos = [a for c in caminhos for a in sorted(glob.glob(c))]
+    if not arquivos:
+        print("⚠️ Nenhum arquivo JSON encontrado")
+        return
+
+    def medir(funcao: Callable[[], Any]) -> float:
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            funcao()
+        return (time.perf_counter() - inicio) / repeticoes * 1000
+
+    print(f"🧪 {len(arquivos)} arquivo(s), {repeticoes} repetições cada (ms por operação)")
+    print(f"{'arquivo':40} {'KB':>8} {'loads json':>11} {'orjson':>8} {'ganho':>6} {'dumps json':>11} {'orjson':>8} {'ganho':>6}")
+    for arquivo in arquivos:
+        with open(arquivo, "rb") as f:
+            bruto = f.read()
+        obj = json.loads(bruto)
+        # Mesma semântica: o valor decodificado e o reencodado batem com a biblioteca padrão
+        assert orjson.loads(bruto) == obj
+        assert json.loads(dumps(obj, default=str)) == json.loads(json.dumps(obj, default=str))
+
+        l_std = medir(lambda: json.loads(bruto))
+        l_orj = medir(lambda: orjson.loads(bruto))
+        d_std = medir(lambda: json.dumps(obj, default=str))
+        d_orj = medir(lambda: dumps(obj, default=str, ensure_ascii=False))
+        nome = os.path.basename(arquivo)[:40]
+        print(f"{nome:40} {len(bruto) / 1024:8.1f} {l_std:11.3f} {l_orj:8.3f} {l_std / l_orj:5.1f}x "
+              f"{d_std:11.3f} {d_orj:8.3f} {d_std / d_orj:5.1f}x")
+
+
+if __name__ == "__main__":
+    import sys
+
+    padrao = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "resultados", "*.json")
+    _benchmark(sys.argv[1:] or [padrao])
@@ -0,0 +1,109 @@
+# rate_limiter.py - Token bucket compartilhado entre threads
+
+# Limita a taxa de requisições de um cliente inteiro (todas as threads do processo).
+# A taxa é reposta continuamente; `burst` define quantas requisições podem sair de uma vez.
+#
+# Requisições esperam em fila por prioridade (menor número = mais urgente): só a
+# primeira da fila consome tokens, então uma consulta interativa passa à frente de
+# qualquer carga em lote que já esteja esperando. `reserve` tokens ficam guardados
+# para a prioridade 0, de modo que a carga em lote usa apenas a capacidade que sobra.
+
+import heapq
+import itertools
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket thread-safe: `rate` tokens por segundo, até `burst` acumulados."""
+
+    def __init__(self, rate: float, burst: int, reserve: int = 0):
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._waiters = []  # heap de (prioridade, ordem de chegada)
+        self._seq = itertools.count()
+        self.configure(rate, burst, reserve)
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: int, burst: int, reserve: int = 0) -> "TokenBucket":
+        """Cria o bucket a partir de um limite em requisições por minuto."""
+        return cls(requests_per_minute / 60.0, burst, reserve)
+
+    def configure(self, rate: float, burst: int, reserve: int = 0) -> None:
+        """Redefine taxa, burst e reserva da prioridade 0. O bucket recomeça cheio."""
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate deve ser > 0 e burst >= 1")
+        if not 0 <= reserve < burst:
+            raise ValueError("reserve deve estar entre 0 e burst - 1")
+        with self._cond:
+            self.rate = float(rate)
+            self.burst = int(burst)
+            self.reserve = int(reserve)
+            self._tokens = float(burst)
+            self._updated = time.monotonic()
+            self._cond.notify_all()
+
+    def _refill(self, now: float) -> None:
+        # `_updated` pode estar no futuro enquanto o bucket estiver drenado
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _wait_time(self, now: float, tokens: float) -> float:
+        blocked = max(0.0, self._updated - now)
+        missing = max(0.0, tokens - self._tokens)
+        return blocked + missing / self.rate
+
+    def _needed(self, tokens: float, priority: int) -> float:
+        # Só a prioridade 0 pode gastar a reserva
+        return tokens + (self.reserve if priority > 0 else 0)
+
+    def try_acquire(self, tokens: float = 1.0, priority: int = 0) -> bool:
+        """Consome tokens se houver saldo e ninguém de prioridade igual ou maior esperando, sem bloquear."""
+        with self._cond:
+            if self._waiters and self._waiters[0][0] <= priority:
+                return False
+            now = time.monotonic()
+            self._refill(now)
+            if self._wait_time(now, self._needed(tokens, priority)) > 0:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1.0, priority: int = 0) -> None:
+        """
+        Bloqueia até haver tokens disponíveis e os consome. Entre as threads
+        esperando, atende primeiro a menor `priority` (na ordem de chegada).
+        """
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    wait = None
+                    if self._waiters[0] == entry:
+                        now = time.monotonic()
+                        self._refill(now)
+                        wait = self._wait_time(now, self._needed(tokens, priority))
+                        if wait <= 0:
+                            self._tokens -= tokens
+                            return
+                    # Quem não é o primeiro da fila dorme até ela andar
+                    self._cond.wait(wait)
+            finally:
+                if self._waiters[0] == entry:
+                    heapq.heappop(self._waiters)
+                else:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def drain(self, seconds: float = 0.0) -> None:
+        """
+        Esvazia o bucket e suspende a reposição por `seconds` segundos.
+        Usado ao receber 429 com Retry-After: todas as threads passam a esperar.
+        """
+        with self._cond:
+            self._tokens = 0.0
+            self._updated = max(self._updated, time.monotonic() + max(0.0, seconds))
@@ -0,0 +1,240 @@
+# senado_agenda.py - Agenda de reuniões das comissões do Senado, indexada em memória
+#
+# Interpreta o feed iCal (`agendareuniao/atual/iCal`) evento a evento (VEVENT por
+# VEVENT) e mantém os eventos indexados por data, comissão e local. Perguntas como
+# "reuniões da CCJ nos próximos 30 dias" são respondidas em memória, sem uma
+# chamada de `agenda_reunioes_por_data` por dia.
+#
+# A atualização é condicional: envia ETag/Last-Modified (304 = nada a fazer),
+# compara o hash do feed e, se ele mudou, reindexa só os eventos novos, alterados
+# ou removidos.
+
+import hashlib
+import io
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import senado_client
+
+# Horário de Brasília (sem horário de verão desde 2019), para horários em UTC (sufixo Z)
+FUSO_BRASILIA = timezone(timedelta(hours=-3))
+
+# Sigla da comissão no início do resumo, ex.: "CCJ - 12ª Reunião Extraordinária"
+_RE_SIGLA = re.compile(r"^\s*([A-Z][A-Z0-9]{1,9})\b")
+
+
+@dataclass(frozen=True)
+class Evento:
+    uid: str
+    inicio: datetime
+    fim: Optional[datetime]
+    resumo: str
+    descricao: str
+    local: str
+    comissao: Optional[str]
+    hash: str
+
+
+def _desescapar(valor: str) -> str:
+    return (valor.replace("\\n", "\n").replace("\\N", "\n").replace("\\,", ",")
+            .replace("\\;", ";").replace("\\\\", "\\"))
+
+
+def _linhas_desdobradas(linhas: Iterable[str]) -> Iterator[str]:
+    """Junta as linhas de continuação do iCal (iniciadas por espaço ou tab)."""
+    atual: Optional[str] = None
+    for linha in linhas:
+        linha = linha.rstrip("\r\n")
+        if linha[:1] in (" ", "\t") and atual is not None:
+            atual += linha[1:]
+            continue
+        if atual is not None:
+            yield atual
+        atual = linha
+    if atual is not None:
+        yield atual
+
+
+def _data_hora(valor: str) -> Optional[datetime]:
+    """DTSTART/DTEND: AAAAMMDD, AAAAMMDDTHHMMSS (horário local) ou ...Z (UTC)."""
+    valor = valor.strip()
+    try:
+        if valor.endswith("Z"):
+            utc = datetime.strptime(valor, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+            return utc.astimezone(FUSO_BRASILIA).replace(tzinfo=None)
+        if "T" in valor:
+            return datetime.strptime(valor[:15], "%Y%m%dT%H%M%S")
+        return datetime.strptime(valor[:8], "%Y%m%d")
+    except ValueError:
+        return None
+
+
+def iter_vevents(linhas: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Propriedades (nome → valor) de cada VEVENT, à medida que o texto é lido."""
+    evento: Optional[Dict[str, str]] = None
+    for linha in _linhas_desdobradas(linhas):
+        if linha == "BEGIN:VEVENT":
+            evento = {}
+        elif linha == "END:VEVENT":
+            if evento is not None:
+                yield evento
+            evento = None
+        elif evento is not None and ":" in linha:
+            nome, valor = linha.split(":", 1)
+            # Parâmetros (ex.: DTSTART;TZID=America/Sao_Paulo) são descartados
+            evento.setdefault(nome.split(";", 1)[0].upper(), valor)
+
+
+def _evento(props: Dict[str, str]) -> Optional[Evento]:
+    inicio = _data_hora(props.get("DTSTART", ""))
+    if inicio is None:
+        return None
+    resumo = _desescapar(props.get("SUMMARY", ""))
+    sigla = _desescapar(props.get("CATEGORIES", "")).split(",")[0].strip()
+    if not sigla:
+        m = _RE_SIGLA.match(resumo)
+        sigla = m.group(1) if m else None
+    conteudo = "\n".join(f"{k}:{props[k]}" for k in sorted(props) if k not in ("DTSTAMP", "SEQUENCE"))
+    digest = hashlib.sha1(conteudo.encode("utf-8")).hexdigest()
+    return Evento(
+        uid=props.get("UID") or digest,
+        inicio=inicio,
+        fim=_data_hora(props["DTEND"]) if "DTEND" in props else None,
+        resumo=resumo,
+        descricao=_desescapar(props.get("DESCRIPTION", "")),
+        local=_desescapar(props.get("LOCATION", "")).strip(),
+        comissao=sigla.upper() if sigla else None,
+        hash=digest,
+    )
+
+
+def _normalizar(texto: str) -> str:
+    return " ".join(texto.upper().split())
+
+
+class AgendaIndex:
+    """Eventos da agenda de comissões indexados por data, comissão e local."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._eventos: Dict[str, Evento] = {}
+        self._por_data: Dict[date, Set[str]] = {}
+        self._por_comissao: Dict[str, Set[str]] = {}
+        self._por_local: Dict[str, Set[str]] = {}
+        self._etag: Optional[str] = None
+        self._modificado_em: Optional[str] = None
+        self._hash_feed: Optional[str] = None
+        self.atualizado_em: Optional[float] = None
+
+    # ---------- atualização ----------
+
+    def _indexar(self, ev: Evento) -> None:
+        self._eventos[ev.uid] = ev
+        self._por_data.setdefault(ev.inicio.date(), set()).add(ev.uid)
+        if ev.comissao:
+            self._por_comissao.setdefault(ev.comissao, set()).add(ev.uid)
+        if ev.local:
+            self._por_local.setdefault(_normalizar(ev.local), set()).add(ev.uid)
+
+    def _desindexar(self, uid: str) -> None:
+        ev = self._eventos.pop(uid)
+        for indice, chave in ((self._por_data, ev.inicio.date()),
+                              (self._por_comissao, ev.comissao),
+                              (self._por_local, _normalizar(ev.local))):
+            uids = indice.get(chave)
+            if uids is not None:
+                uids.discard(uid)
+                if not uids:
+                    del indice[chave]
+
+    def aplicar(self, texto: str) -> Tuple[int, int, int]:
+        """Reindexa a partir do texto iCal. Retorna (novos, alterados, removidos)."""
+        hash_feed = hashlib.sha1(texto.encode("utf-8")).hexdigest()
+        with self._lock:
+            if hash_feed == self._hash_feed:
+                self.atualizado_em = time.time()
+                return 0, 0, 0
+            novos = alterados = 0
+            vistos: Set[str] = set()
+            for props in iter_vevents(io.StringIO(texto)):
+                ev = _evento(props)
+                if ev is None:
+                    continue
+                vistos.add(ev.uid)
+                atual = self._eventos.get(ev.uid)
+                if atual is not None and atual.hash == ev.hash:
+                    continue
+                if atual is not None:
+                    self._desindexar(ev.uid)
+                    alterados += 1
+                else:
+                    novos += 1
+                self._indexar(ev)
+            removidos = [uid for uid in self._eventos if uid not in vistos]
+            for uid in removidos:
+                self._desindexar(uid)
+            self._hash_feed = hash_feed
+            self.atualizado_em = time.time()
+            return novos, alterados, len(removidos)
+
+    def atualizar(self) -> Tuple[int, int, int]:
+        """Busca o feed com GET condicional e aplica só as diferenças."""
+        texto, headers = senado_client.agenda_reunioes_atual_ical_condicional(self._etag, self._modificado_em)
+        self._etag = headers.get("ETag") or self._etag
+        self._modificado_em = headers.get("Last-Modified") or self._modificado_em
+        if texto is None:
+            self.atualizado_em = time.time()
+            return 0, 0, 0
+        return self.aplicar(texto)
+
+    def atualizar_se_necessario(self, intervalo_s: float = 3600) -> bool:
+        if self.atualizado_em is not None and time.time() - self.atualizado_em < intervalo_s:
+            return False
+        self.atualizar()
+        return True
+
+    # ---------- consultas ----------
+
+    def _ordenados(self, uids: Iterable[str]) -> List[Evento]:
+        return sorted((self._eventos[u] for u in uids), key=lambda ev: (ev.inicio, ev.uid))
+
+    def eventos_em(self, dia: date) -> List[Evento]:
+        with self._lock:
+            return self._ordenados(self._por_data.get(dia, ()))
+
+    def eventos_periodo(
+        self,
+        inicio: date,
+        fim: date,
+        comissao: Optional[str] = None,
+        local: Optional[str] = None,
+    ) -> List[Evento]:
+        """Eventos entre as datas (inclusive), opcionalmente de uma comissão e/ou local."""
+        with self._lock:
+            uids: Set[str] = set()
+            dia = inicio
+            while dia <= fim:
+                uids |= self._por_data.get(dia, set())
+                dia += timedelta(days=1)
+            if comissao is not None:
+                uids &= self._por_comissao.get(comissao.strip().upper(), set())
+            if local is not None:
+                uids &= self._por_local.get(_normalizar(local), set())
+            return self._ordenados(uids)
+
+    def proximas_reunioes(self, comissao: Optional[str] = None, dias: int = 30) -> List[Evento]:
+        """Reuniões de hoje até `dias` à frente (ex.: próximas da CCJ)."""
+        hoje = date.today()
+        return self.eventos_periodo(hoje, hoje + timedelta(days=dias), comissao=comissao)
+
+    def comissoes(self) -> List[str]:
+        with self._lock:
+            return sorted(self._por_comissao)
+
+    def locais(self) -> List[str]:
+        with self._lock:
+            return sorted({self._eventos[next(iter(u))].local for u in self._por_local.values()})
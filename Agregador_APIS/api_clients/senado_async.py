@@ -0,0 +1,282 @@
+# senado_async.py - Cliente assíncrono dos Dados Abertos do Senado
+
+# Mesmos endpoints do senado_client, sobre um httpx.AsyncClient com pool de
+# conexões keep-alive. Um semáforo limita as requisições simultâneas e o ritmo é
+# dado pelo mesmo token bucket do cliente síncrono (RATE_LIMIT_PER_MINUTE), de modo
+# que os dois clientes juntos respeitam o orçamento do Senado. O retry e o
+# tratamento de 429 seguem o cliente síncrono: o Retry-After pausa todas as requisições.
+#
+# Uso:
+#     async with SenadoAsyncClient() as senado:
+#         detalhes = await senado.em_lote(senado.detalhar_senador_por_codigo, codigos)
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from json_codec import decode_response
+from senado_client import HEADERS, SenadoAPIError, _build_url, _rate_limiter, _retry_after
+from single_flight import request_key
+
+MAX_CONCORRENCIA = 8
+MAX_CONEXOES = 10
+TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+
+def _validar_data(valor: str, nome: str) -> None:
+    if not (len(valor) == 8 and valor.isdigit()):
+        raise ValueError(f"{nome} deve estar no formato AAAAMMDD")
+
+
+class SenadoAsyncClient:
+    """Cliente assíncrono do Senado com pool de conexões e concorrência limitada."""
+
+    def __init__(self, max_concorrencia: int = MAX_CONCORRENCIA, max_conexoes: int = MAX_CONEXOES):
+        self.client = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=max_conexoes, max_connections=max_conexoes),
+        )
+        self._semaforo = asyncio.Semaphore(max_concorrencia)
+        # Requisições idênticas simultâneas compartilham a mesma tarefa
+        self._em_voo: Dict[tuple, asyncio.Future] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    # ---------- requisições ----------
+
+    async def _request(self, path: str, params: Optional[Dict[str, Any]] = None, fmt: str = "json", max_retries: int = 3) -> Union[Dict[str, Any], str]:
+        """
+        Requisição com retry. Chamadas simultâneas para o mesmo recurso compartilham
+        o mesmo resultado decodificado (que não deve ser modificado pelo chamador).
+        """
+        url = _build_url(path, fmt=fmt)
+        chave = request_key(url, params, fmt)
+        futuro = self._em_voo.get(chave)
+        if futuro is None:
+            futuro = asyncio.ensure_future(self._request_uncoalesced(url, params, fmt, max_retries))
+            self._em_voo[chave] = futuro
+            futuro.add_done_callback(lambda _: self._em_voo.pop(chave, None))
+        # shield: o cancelamento de um chamador não cancela a requisição dos demais
+        return await asyncio.shield(futuro)
+
+    async def _request_uncoalesced(self, url: str, params: Optional[Dict[str, Any]], fmt: str, max_retries: int) -> Union[Dict[str, Any], str]:
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    await asyncio.sleep(2)
+
+                async with self._semaforo:
+                    # O bucket é bloqueante (compartilhado com as threads do cliente síncrono)
+                    await asyncio.to_thread(_rate_limiter.acquire)
+                    resp = await self.client.get(url, params=params)
+
+                if resp.status_code == 429:
+                    retry_after = _retry_after(resp.headers)
+                    print(f"⏳ Rate limit atingido. Aguardando {retry_after}s...")
+                    # Suspende o bucket: as próximas requisições (síncronas ou não) esperam
+                    _rate_limiter.drain(retry_after)
+                    continue
+
+                resp.raise_for_status()
+
+                if fmt == "json":
+                    return decode_response(resp)
+                return resp.text
+
+            except httpx.TimeoutException:
+                if attempt == max_retries - 1:
+                    raise SenadoAPIError(f"Timeout após {max_retries} tentativas em {url}")
+                print(f"⏳ Timeout na tentativa {attempt + 1}/{max_retries}, tentando novamente...")
+
+            except httpx.HTTPStatusError as e:
+                raise SenadoAPIError(f"HTTP {e.response.status_code} ao acessar {url}", status_code=e.response.status_code) from e
+
+            except httpx.RequestError as e:
+                if attempt == max_retries - 1:
+                    raise SenadoAPIError(f"Erro de rede ao acessar {url}: {e}") from e
+                print(f"⚠️ Erro de rede na tentativa {attempt + 1}/{max_retries}, tentando novamente...")
+
+            except ValueError as e:
+                raise SenadoAPIError(f"Erro ao decodificar JSON em {url}: {e}") from e
+
+        raise SenadoAPIError(f"Falha após {max_retries} tentativas em {url}")
+
+    async def em_lote(
+        self,
+        funcao: Callable[..., Awaitable[Any]],
+        argumentos: Iterable[Any],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Executa `funcao(arg)` para cada argumento em paralelo (limitado pelo semáforo)
+        e devolve os resultados na ordem dos argumentos. Tuplas são desempacotadas.
+        Com `return_exceptions=True`, falhas aparecem na lista no lugar do resultado.
+        """
+        tarefas = [funcao(*arg) if isinstance(arg, tuple) else funcao(arg) for arg in argumentos]
+        return await asyncio.gather(*tarefas, return_exceptions=return_exceptions)
+
+    # ==========================
+    # Senadores
+    # ==========================
+
+    async def listar_senadores_em_exercicio(self) -> Dict[str, Any]:
+        return await self._request("senador/lista/atual")
+
+    async def detalhar_senador_por_codigo(self, codigo_senador: int) -> Dict[str, Any]:
+        return await self._request(f"senador/{codigo_senador}")
+
+    async def votos_senador(
+        self,
+        codigo_senador: int,
+        *,
+        sigla: Optional[str] = None,
+        tramitando: Optional[str] = None,
+        tipo: Optional[str] = None,
+        tipo_sessao: Optional[str] = None,
+        ano: Optional[int] = None,
+        primeiro: Optional[str] = None
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if sigla: params["sigla"] = sigla
+        if tramitando: params["tramitando"] = tramitando
+        if tipo: params["tipo"] = tipo
+        if tipo_sessao: params["tipoSessao"] = tipo_sessao
+        if ano: params["ano"] = ano
+        if primeiro: params["primeiro"] = primeiro
+        return await self._request(f"senador/{codigo_senador}/votacoes", params=params)
+
+    # ==========================
+    # Matérias
+    # ==========================
+
+    async def obter_materia_por_codigo(self, codigo_materia: int) -> Dict[str, Any]:
+        return await self._request(f"materia/{codigo_materia}")
+
+    async def listar_materias_atualizadas(
+        self,
+        numdias: int = 15,
+        *,
+        sigla: Optional[str] = None,
+        numero: Optional[int] = None,
+        ano: Optional[int] = None,
+        codigo: Optional[int] = None,
+        codAssuntoGeral: Optional[int] = None,
+        codAssuntoEspecifico: Optional[int] = None,
+        alteracao: Optional[str] = None
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"numdias": numdias}
+        if sigla: params["sigla"] = sigla
+        if numero: params["numero"] = numero
+        if ano: params["ano"] = ano
+        if codigo: params["codigo"] = codigo
+        if codAssuntoGeral: params["codAssuntoGeral"] = codAssuntoGeral
+        if codAssuntoEspecifico: params["codAssuntoEspecifico"] = codAssuntoEspecifico
+        if alteracao: params["alteracao"] = alteracao
+        return await self._request("materia/atualizadas", params=params)
+
+    async def listar_tramitacao_por_tipo(
+        self,
+        *,
+        sigla: str,
+        situacao: Optional[str] = None,
+        ano: Optional[int] = None,
+        comissao: Optional[str] = None
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"sigla": sigla}
+        if situacao: params["situacao"] = situacao
+        if ano: params["ano"] = ano
+        if comissao: params["comissao"] = comissao
+        return await self._request("materia/lista/tramitacao", params=params)
+
+    # ==========================
+    # Comissões
+    # ==========================
+
+    async def listar_comissoes(self, tipo: str = "permanente") -> Dict[str, Any]:
+        tipo = tipo.strip().lower()
+        if tipo not in {"permanente", "temporaria", "cpi"}:
+            raise ValueError("tipo deve ser 'permanente', 'temporaria' ou 'cpi'")
+        return await self._request(f"comissao/lista/{tipo}")
+
+    async def documentos_da_comissao(
+        self,
+        sigla: str,
+        *,
+        data_inicio_yyyymmdd: Optional[str] = None,
+        data_fim_yyyymmdd: Optional[str] = None
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if data_inicio_yyyymmdd:
+            _validar_data(data_inicio_yyyymmdd, "data_inicio_yyyymmdd")
+            params["dataInicio"] = data_inicio_yyyymmdd
+        if data_fim_yyyymmdd:
+            _validar_data(data_fim_yyyymmdd, "data_fim_yyyymmdd")
+            params["dataFim"] = data_fim_yyyymmdd
+        sigla = sigla.strip().upper()
+        return await self._request(f"comissao/{sigla}/documentos", params=params)
+
+    # ==========================
+    # Agenda (Comissões)
+    # ==========================
+
+    async def agenda_reunioes_por_data(self, data_yyyymmdd: str) -> Dict[str, Any]:
+        _validar_data(data_yyyymmdd, "data_yyyymmdd")
+        return await self._request(f"agendareuniao/{data_yyyymmdd}")
+
+    async def agenda_reunioes_atual_ical(self) -> str:
+        return await self._request("agendareuniao/atual/iCal", fmt="txt")
+
+    # ==========================
+    # Plenário — votações
+    # ==========================
+
+    async def votacoes_plenario_por_data(self, data_yyyymmdd: str) -> Dict[str, Any]:
+        _validar_data(data_yyyymmdd, "data_yyyymmdd")
+        return await self._request(f"plenario/lista/votacao/{data_yyyymmdd}")
+
+    # ==========================
+    # Tabelas auxiliares (XML)
+    # ==========================
+
+    async def listar_assuntos_materia_xml(self) -> str:
+        return await self._request("dados/ListaAssuntos", fmt="xml")
+
+    async def listar_classificacoes_materia_xml(self) -> str:
+        return await self._request("dados/ListaClassificacoesMateria", fmt="xml")
+
+    async def listar_tipos_emenda_xml(self) -> str:
+        return await self._request("dados/ListaTiposEmenda", fmt="xml")
+
+    async def listar_tipos_natureza_xml(self) -> str:
+        return await self._request("dados/ListaTiposNatureza", fmt="xml")
+
+    async def listar_tipos_decisao_xml(self) -> str:
+        return await self._request("dados/ListaTiposDecisao", fmt="xml")
+
+    async def listar_destinos_xml(self) -> str:
+        return await self._request("dados/ListaDestinos", fmt="xml")
+
+    async def baixar_termos_legislacao_xml(self) -> str:
+        return await self._request("legislacao/termos", fmt="xml")
+
+
+def executar_em_lote(nome_metodo: str, argumentos: Iterable[Any], **kwargs) -> List[Any]:
+    """
+    Atalho síncrono: abre um cliente, executa o método em lote e fecha. Ex.:
+
+    executar_em_lote("votacoes_plenario_por_data", ["20240305", "20240306"])
+    """
+    async def rodar():
+        async with SenadoAsyncClient() as senado:
+            return await senado.em_lote(getattr(senado, nome_metodo), argumentos, **kwargs)
+
+    return asyncio.run(rodar())
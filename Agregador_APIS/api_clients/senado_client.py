@@ -1,22 +1,58 @@
 # senado_client.py - VERSÃO FINAL CORRIGIDA
 
 import requests
+import threading
 import time
+import xml.etree.ElementTree as ET
 from time import sleep
-from typing import Any, Dict, Optional, Tuple, Union, List
-from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union, List
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import json
 
+from json_codec import decode_response
+from rate_limiter import TokenBucket
+from single_flight import SingleFlight, request_key
+
 BASE_URL = "https://legis.senado.leg.br/dadosabertos"
 HEADERS = {"User-Agent": "ProjetoBuscaOficiais/1.0"}
 TIMEOUT = (10, 30)
 
 class SenadoAPIError(Exception):
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+# Orçamento de requisições do Senado (mesmo de API_CONFIG["senado_federal"]):
+# 100 requisições por minuto com burst de 25, compartilhado por todas as threads
+RATE_LIMIT_PER_MINUTE = 100
+RATE_LIMIT_BURST = 25
+
+_rate_limiter = TokenBucket.per_minute(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
+
+def configurar_rate_limit(requests_per_minute: int = RATE_LIMIT_PER_MINUTE, burst: int = RATE_LIMIT_BURST) -> None:
+    """Ajusta o limite de requisições compartilhado por todas as chamadas ao Senado."""
+    _rate_limiter.configure(requests_per_minute / 60.0, burst)
 
 _session = requests.Session()
 _session.headers.update(HEADERS)
 
+def _retry_after(headers: Mapping[str, str], default: int = 30) -> int:
+    """Lê o Retry-After em segundos ou como data HTTP, com valor padrão se ausente ou inválido."""
+    valor = (headers.get('retry-after') or '').strip()
+    if valor.isdigit():
+        return int(valor)
+    try:
+        quando = parsedate_to_datetime(valor)
+    except (TypeError, ValueError):
+        return default
+    if quando.tzinfo is None:
+        quando = quando.replace(tzinfo=timezone.utc)
+    return max(0, int((quando - datetime.now(timezone.utc)).total_seconds()))
+
+# Requisições idênticas simultâneas (mesma URL + parâmetros) viram uma só
+_single_flight = SingleFlight()
+
 def _build_url(path: str, fmt: str = "json") -> str:
     """Constrói URL com tratamento correto de formato"""
     path = path.strip("/")
@@ -34,27 +70,46 @@ def _build_url(path: str, fmt: str = "json") -> str:
     return final_url
 
 def _request(path: str, params: Optional[Dict[str, Any]] = None, fmt: str = "json", max_retries: int = 3) -> Union[Dict[str, Any], str]:
-    """Função de requisição com rate limiting e retry logic"""
+    """
+    Função de requisição com rate limiting e retry logic.
+    Chamadas simultâneas para o mesmo recurso compartilham uma única requisição
+    e o mesmo resultado decodificado (que não deve ser modificado pelo chamador).
+    """
     url = _build_url(path, fmt=fmt)
-    
+    return _single_flight.do(
+        request_key(url, params, fmt),
+        lambda: _request_uncoalesced(url, params, fmt, max_retries)
+    )
+
+def _request_uncoalesced(url: str, params: Optional[Dict[str, Any]], fmt: str, max_retries: int) -> Union[Dict[str, Any], str]:
+    resp = _get_response(url, params, max_retries)
+    if fmt == "json":
+        try:
+            return decode_response(resp)
+        except ValueError as e:
+            raise SenadoAPIError(f"Erro ao decodificar JSON em {url}: {e}") from e
+    return resp.text
+
+def _get_response(url: str, params: Optional[Dict[str, Any]], max_retries: int, stream: bool = False, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    """GET com retry e espera em 429. Com `stream=True` o corpo é lido sob demanda."""
     for attempt in range(max_retries):
         try:
             if attempt > 0:
                 sleep(2)
             
-            resp = _session.get(url, params=params, timeout=TIMEOUT)
+            _rate_limiter.acquire()
+            resp = _session.get(url, params=params, timeout=TIMEOUT, stream=stream, headers=headers)
             
             if resp.status_code == 429:
-                retry_after = int(resp.headers.get('retry-after', 30))
+                retry_after = _retry_after(resp.headers)
+                resp.close()
                 print(f"⏳ Rate limit atingido. Aguardando {retry_after}s...")
-                sleep(retry_after)
+                # Suspende o bucket: todas as threads esperam, não só esta
+                _rate_limiter.drain(retry_after)
                 continue
                 
             resp.raise_for_status()
-            
-            if fmt == "json":
-                return resp.json()
-            return resp.text
+            return resp
             
         except requests.Timeout:
             if attempt == max_retries - 1:
@@ -63,15 +118,12 @@ def _request(path: str, params: Optional[Dict[str, Any]] = None, fmt: str = "jso
             
         except requests.HTTPError as e:
             status = e.response.status_code if e.response is not None else None
-            raise SenadoAPIError(f"HTTP {status} ao acessar {url}") from e
+            raise SenadoAPIError(f"HTTP {status} ao acessar {url}", status_code=status) from e
             
         except requests.RequestException as e:
             if attempt == max_retries - 1:
                 raise SenadoAPIError(f"Erro de rede ao acessar {url}: {e}") from e
             print(f"⚠️ Erro de rede na tentativa {attempt + 1}/{max_retries}, tentando novamente...")
-            
-        except ValueError as e:
-            raise SenadoAPIError(f"Erro ao decodificar JSON em {url}: {e}") from e
     
     raise SenadoAPIError(f"Falha após {max_retries} tentativas em {url}")
 
@@ -79,46 +131,114 @@ def _request(path: str, params: Optional[Dict[str, Any]] = None, fmt: str = "jso
 # Utilitários de navegação
 # --------------------------
 
-def _iter_dicts_in(obj: Any) -> List[Dict[str, Any]]:
+# Caminho até a lista de registros de cada endpoint (chaves de dict ou índices de
+# lista). Os declarados aqui valem desde a primeira chamada; para os demais, o
+# caminho é descoberto pela varredura na primeira resposta e reaproveitado depois.
+Caminho = Tuple[Union[str, int], ...]
+
+_CAMINHOS: Dict[str, Caminho] = {
+    "senador/lista/atual": ("ListaParlamentarEmExercicio", "Parlamentares", "Parlamentar"),
+    "senador/{id}/votacoes": ("VotacaoParlamentar", "Parlamentar", "Votacoes", "Votacao"),
+}
+_caminhos_aprendidos: Dict[str, Caminho] = {}
+
+def _endpoint_key(path: str) -> str:
+    """Normaliza o path para a chave do endpoint: segmentos numéricos viram {id}."""
+    partes = path.strip("/").split("?")[0].split("/")
+    return "/".join("{id}" if p.isdigit() else p for p in partes)
+
+def _dicts_da_lista(lista: List[Any]) -> List[Dict[str, Any]]:
+    # Caso liste de listas, achamos o primeiro nível com dict
+    flat = []
+    for item in lista:
+        if isinstance(item, dict):
+            flat.append(item)
+        elif isinstance(item, list):
+            for sub in item:
+                if isinstance(sub, dict):
+                    flat.append(sub)
+    return flat
+
+def _varrer(obj: Any) -> Tuple[Optional[Caminho], List[Dict[str, Any]]]:
     """
-    Varre o objeto e retorna a primeira lista de dicts encontrada (profundidade arbitrária).
-    Ajuda quando chaves internas variam (ex.: 'Comissoes' vs 'Colegiados').
+    Busca em profundidade (iterativa, na mesma ordem da antiga versão recursiva)
+    pela primeira lista de dicts. Retorna (caminho, lista) ou (None, []).
     """
-    result: List[Dict[str, Any]] = []
-
-    def dfs(node: Any):
-        nonlocal result
-        if result:
-            return
+    pilha: List[Tuple[Any, Caminho]] = [(obj, ())]
+    while pilha:
+        node, caminho = pilha.pop()
         if isinstance(node, list):
-            # Caso liste de listas, achamos o primeiro nível com dict
-            flat = []
-            for item in node:
-                if isinstance(item, dict):
-                    flat.append(item)
-                elif isinstance(item, list):
-                    for sub in item:
-                        if isinstance(sub, dict):
-                            flat.append(sub)
+            flat = _dicts_da_lista(node)
             if flat:
-                result = flat
-                return
-            for item in node:
-                dfs(item)
+                return caminho, flat
+            pilha.extend((item, caminho + (i,)) for i, item in reversed(list(enumerate(node))))
         elif isinstance(node, dict):
-            for v in node.values():
-                if result:
-                    return
-                dfs(v)
+            pilha.extend((v, caminho + (k,)) for k, v in reversed(list(node.items())))
+    return None, []
 
-    dfs(obj)
-    return result
+def _seguir(obj: Any, caminho: Caminho) -> Optional[List[Dict[str, Any]]]:
+    """Desce pelo caminho com acesso direto. None se o formato da resposta mudou."""
+    node = obj
+    for passo in caminho:
+        try:
+            node = node[passo]
+        except (KeyError, IndexError, TypeError):
+            return None
+    if isinstance(node, dict):
+        # Com um único registro a API devolve o objeto em vez de uma lista
+        return [node]
+    if isinstance(node, list):
+        return _dicts_da_lista(node)
+    return None
+
+def extrair_registros(obj: Any, endpoint: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Lista de registros da resposta. Com `endpoint` (path usado na requisição),
+    usa o caminho declarado em _CAMINHOS ou, para endpoints sem caminho declarado,
+    o aprendido; a varredura completa só roda na primeira resposta do endpoint ou
+    quando o caminho conhecido deixa de existir.
+
+    Um caminho declarado nunca é substituído. Se a resposta tem a raiz declarada
+    mas não o resto do caminho (ex.: ano sem votações), não há registros; só uma
+    raiz diferente (formato mudou) cai na varredura, sem aprender o resultado.
+    """
+    chave = _endpoint_key(endpoint) if endpoint else None
+    declarado = _CAMINHOS.get(chave) if chave else None
+    if declarado is not None:
+        registros = _seguir(obj, declarado)
+        if registros is not None:
+            return registros
+        if isinstance(obj, dict) and declarado[0] in obj:
+            return []
+        return _varrer(obj)[1]
+    if chave:
+        caminho = _caminhos_aprendidos.get(chave)
+        if caminho is not None:
+            registros = _seguir(obj, caminho)
+            if registros is not None:
+                return registros
+    caminho, registros = _varrer(obj)
+    if chave and caminho is not None:
+        _caminhos_aprendidos[chave] = caminho
+    return registros
 
-def _peek_any_list(obj: Any, label: str = "Lista"):
+def _iter_dicts_in(obj: Any) -> List[Dict[str, Any]]:
+    """
+    Varre o objeto e retorna a primeira lista de dicts encontrada (profundidade arbitrária).
+    Ajuda quando chaves internas variam (ex.: 'Comissoes' vs 'Colegiados').
+    Prefira `extrair_registros(obj, endpoint)`, que evita a varredura a cada resposta.
+    """
+    return _varrer(obj)[1]
+
+def registros(path: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Requisita o endpoint JSON e devolve diretamente a lista de registros."""
+    return extrair_registros(_request(path, params=params), path)
+
+def _peek_any_list(obj: Any, label: str = "Lista", endpoint: Optional[str] = None):
     """
     Imprime o tamanho e um exemplo da primeira lista de dicts encontrada.
     """
-    lst = _iter_dicts_in(obj)
+    lst = extrair_registros(obj, endpoint)
     print(f"{label} - itens: {len(lst)} | Exemplo:", lst[0] if lst else None)
 
 # ==========================
@@ -232,6 +352,21 @@ def agenda_reunioes_por_data(data_yyyymmdd: str) -> Dict[str, Any]:
 def agenda_reunioes_atual_ical() -> str:
     return _request("agendareuniao/atual/iCal", fmt="txt")
 
+def agenda_reunioes_atual_ical_condicional(etag: Optional[str] = None, modificado_em: Optional[str] = None) -> Tuple[Optional[str], Mapping[str, str]]:
+    """
+    iCal da agenda com GET condicional (If-None-Match / If-Modified-Since).
+    Retorna (texto, headers da resposta), ou (None, headers) se não mudou (304).
+    """
+    headers: Dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modificado_em:
+        headers["If-Modified-Since"] = modificado_em
+    resp = _get_response(_build_url("agendareuniao/atual/iCal", fmt="txt"), None, max_retries=3, headers=headers)
+    if resp.status_code == 304:
+        return None, resp.headers
+    return resp.text, resp.headers
+
 # ==========================
 # Plenário — votações (CORRIGIDO COM URL REAL!)
 # ==========================
@@ -272,6 +407,141 @@ def listar_destinos_xml() -> str:
 def baixar_termos_legislacao_xml() -> str:
     return _request("legislacao/termos", fmt="xml")
 
+# ==========================
+# Tabelas auxiliares (XML) — modo interpretado
+# ==========================
+
+# As tabelas de referência mudam raramente: o resultado interpretado fica em
+# memória por XML_CACHE_TTL segundos
+XML_CACHE_TTL = 24 * 3600
+
+_xml_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[Dict[str, Any]]]] = {}
+_xml_cache_lock = threading.Lock()
+
+def _tag(elem: ET.Element) -> str:
+    # Remove o namespace ({uri}Tag), se houver
+    return elem.tag.rsplit("}", 1)[-1]
+
+def _acrescentar(registro: Dict[str, Any], chave: str, valor: str) -> None:
+    # Tags repetidas no mesmo registro viram lista
+    if chave not in registro:
+        registro[chave] = valor
+    elif isinstance(registro[chave], list):
+        registro[chave].append(valor)
+    else:
+        registro[chave] = [registro[chave], valor]
+
+def _achatar(elem: ET.Element) -> Dict[str, Any]:
+    """Converte o elemento em dict plano: folhas descendentes com chaves pontuadas (A.B.C)."""
+    registro: Dict[str, Any] = {k: v for k, v in elem.attrib.items()}
+    pilha = [(filho, _tag(filho)) for filho in reversed(elem)]
+    while pilha:
+        no, caminho = pilha.pop()
+        for k, v in no.attrib.items():
+            _acrescentar(registro, f"{caminho}@{k}", v)
+        if len(no):
+            pilha.extend((filho, f"{caminho}.{_tag(filho)}") for filho in reversed(no))
+        else:
+            _acrescentar(registro, caminho, (no.text or "").strip())
+    return registro
+
+def iter_registros_xml(
+    path: str,
+    registro: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    heuristica: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lê a resposta XML em streaming e produz um dict plano por registro, liberando
+    cada elemento depois de processado (memória limitada ao registro atual).
+
+    `registro` é a tag dos registros (ex.: "Assunto"). Sem ela, é preciso pedir
+    `heuristica=True`: registro passa a ser todo elemento cujos filhos são apenas
+    folhas, o que também pega blocos como Metadados e partes aninhadas de um registro.
+    """
+    if registro is None and not heuristica:
+        raise ValueError("informe a tag `registro` ou use heuristica=True")
+    url = _build_url(path, fmt="xml")
+    resp = _get_response(url, params, max_retries=3, stream=True)
+    resp.raw.decode_content = True
+    # Pilha de [elemento, já teve registros removidos]: um contêiner esvaziado não é registro
+    pilha: List[List[Any]] = []
+    try:
+        for evento, elem in ET.iterparse(resp.raw, events=("start", "end")):
+            if evento == "start":
+                pilha.append([elem, False])
+                continue
+            _, esvaziado = pilha.pop()
+            if registro is not None:
+                eh_registro = _tag(elem) == registro
+            else:
+                eh_registro = not esvaziado and len(elem) > 0 and all(len(filho) == 0 for filho in elem)
+            if eh_registro:
+                yield _achatar(elem)
+                # Desliga o registro da árvore para que ela não cresça com o documento
+                if pilha:
+                    pilha[-1][0].remove(elem)
+                    pilha[-1][1] = True
+    except ET.ParseError as e:
+        raise SenadoAPIError(f"Erro ao interpretar XML em {url}: {e}") from e
+    except requests.RequestException as e:
+        raise SenadoAPIError(f"Erro de rede ao ler {url}: {e}") from e
+    finally:
+        resp.close()
+
+def registros_xml(path: str, registro: Optional[str] = None, heuristica: bool = False) -> List[Dict[str, Any]]:
+    """
+    Registros de uma tabela XML de referência (ver `iter_registros_xml`), interpretados
+    uma vez e mantidos em cache por XML_CACHE_TTL. A lista é compartilhada e não deve
+    ser modificada. Uma tabela sem nenhum registro não fica em cache.
+    """
+    if registro is None and not heuristica:
+        raise ValueError("informe a tag `registro` ou use heuristica=True")
+    chave = (path, registro)
+    with _xml_cache_lock:
+        entrada = _xml_cache.get(chave)
+    if entrada and entrada[0] > time.time():
+        return entrada[1]
+
+    def interpretar() -> List[Dict[str, Any]]:
+        registros = list(iter_registros_xml(path, registro, heuristica=heuristica))
+        if registros:
+            with _xml_cache_lock:
+                _xml_cache[chave] = (time.time() + XML_CACHE_TTL, registros)
+        return registros
+
+    # Chamadas simultâneas para a mesma tabela interpretam o XML uma única vez
+    return _single_flight.do(("xml",) + chave, interpretar)
+
+def limpar_cache_xml() -> None:
+    with _xml_cache_lock:
+        _xml_cache.clear()
+
+def listar_assuntos_materia() -> List[Dict[str, Any]]:
+    return registros_xml("dados/ListaAssuntos", "Assunto")
+
+def listar_classificacoes_materia() -> List[Dict[str, Any]]:
+    return registros_xml("dados/ListaClassificacoesMateria", "Classificacao")
+
+def listar_tipos_emenda() -> List[Dict[str, Any]]:
+    return registros_xml("dados/ListaTiposEmenda", "TipoEmenda")
+
+def listar_tipos_natureza() -> List[Dict[str, Any]]:
+    return registros_xml("dados/ListaTiposNatureza", "TipoNatureza")
+
+def listar_tipos_decisao() -> List[Dict[str, Any]]:
+    return registros_xml("dados/ListaTiposDecisao", "TipoDecisao")
+
+def listar_destinos() -> List[Dict[str, Any]]:
+    return registros_xml("dados/ListaDestinos", "Destino")
+
+def termos_legislacao() -> List[Dict[str, Any]]:
+    return registros_xml("legislacao/termos", "Termo")
+
+def iter_termos_legislacao() -> Iterator[Dict[str, Any]]:
+    """Termos da legislação em streaming, sem cache (o documento é grande)."""
+    return iter_registros_xml("legislacao/termos", "Termo")
+
 # ==========================
 # Sistema de Testes Melhorado
 # ==========================
@@ -393,7 +663,7 @@ def test_all_endpoints():
     codigo_senador = None
     try:
         sen_data = listar_senadores_em_exercicio()
-        lst = _iter_dicts_in(sen_data)
+        lst = extrair_registros(sen_data, "senador/lista/atual")
         if lst:
             for item in lst[:3]:
                 ident = item.get("IdentificacaoParlamentar", item)
@@ -0,0 +1,115 @@
+# senado_plenario.py - Votações do plenário do Senado por intervalo de datas
+#
+# `votacoes_plenario_por_data` aceita um dia por chamada. Este módulo busca um
+# intervalo dia a dia em paralelo (limitado por max_workers e pelo rate limit do
+# senado_client). Dias anteriores a hoje não mudam mais: a resposta fica no cache
+# em disco para sempre, inclusive quando o dia não teve votação (ou a API respondeu
+# 404), e uma nova execução do mesmo intervalo só vai à rede para o dia de hoje.
+#
+# Uso: python senado_plenario.py 20240101 20241231 [--cache senado_cache.sqlite3] [--workers 4]
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import senado_client
+from disk_cache import DiskCache
+
+CACHE_PATH = "senado_cache.sqlite3"
+MAX_WORKERS = 4
+
+# Resposta guardada para dias em que a API respondeu 404 (sem sessão/votação)
+DIA_VAZIO: Dict[str, Any] = {}
+
+_caches: Dict[str, DiskCache] = {}
+
+
+def _cache(caminho: str) -> DiskCache:
+    # Um DiskCache por arquivo, compartilhado entre as threads
+    if caminho not in _caches:
+        _caches[caminho] = DiskCache(caminho)
+    return _caches[caminho]
+
+
+def _dias(inicio: date, fim: date) -> List[date]:
+    return [inicio + timedelta(days=i) for i in range((fim - inicio).days + 1)]
+
+
+def _parse_data(valor: str) -> date:
+    return datetime.strptime(valor, "%Y%m%d").date()
+
+
+def votacoes_do_dia(dia: date, cache: Optional[DiskCache] = None) -> Dict[str, Any]:
+    """Resposta de `votacoes_plenario_por_data` para o dia, pelo cache quando o dia já passou."""
+    yyyymmdd = dia.strftime("%Y%m%d")
+    chave = f"plenario/lista/votacao/{yyyymmdd}"
+    passado = dia < date.today()
+    if cache is not None and passado:
+        encontrado, valor = cache.get(chave)
+        if encontrado:
+            return valor
+
+    try:
+        resposta = senado_client.votacoes_plenario_por_data(yyyymmdd)
+    except senado_client.SenadoAPIError as e:
+        if e.status_code != 404:
+            raise
+        resposta = DIA_VAZIO
+
+    if cache is not None and passado:
+        # Dia encerrado: permanente, mesmo vazio
+        cache.set(chave, resposta)
+    return resposta
+
+
+def votacoes_plenario_periodo(
+    inicio: date,
+    fim: date,
+    max_workers: int = MAX_WORKERS,
+    cache_path: Optional[str] = CACHE_PATH,
+) -> Dict[date, Dict[str, Any]]:
+    """
+    Respostas de todos os dias do intervalo (inclusive), buscadas em paralelo.
+    `cache_path=None` desliga o cache em disco. Retorna {dia: resposta} em ordem.
+    """
+    if fim < inicio:
+        raise ValueError("fim deve ser igual ou posterior a inicio")
+    cache = _cache(cache_path) if cache_path else None
+    dias = _dias(inicio, fim)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(dias)))) as executor:
+        respostas = list(executor.map(lambda dia: votacoes_do_dia(dia, cache), dias))
+    return dict(zip(dias, respostas))
+
+
+def registros_votacoes_periodo(
+    inicio: date,
+    fim: date,
+    max_workers: int = MAX_WORKERS,
+    cache_path: Optional[str] = CACHE_PATH,
+) -> List[Dict[str, Any]]:
+    """Votações do intervalo como uma lista única de registros, em ordem de data."""
+    registros: List[Dict[str, Any]] = []
+    for dia, resposta in votacoes_plenario_periodo(inicio, fim, max_workers, cache_path).items():
+        if resposta:
+            registros.extend(senado_client.extrair_registros(resposta, f"plenario/lista/votacao/{dia:%Y%m%d}"))
+    return registros
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Votações do plenário do Senado por intervalo de datas")
+    parser.add_argument("inicio", help="primeiro dia (AAAAMMDD)")
+    parser.add_argument("fim", help="último dia (AAAAMMDD)")
+    parser.add_argument("--cache", default=CACHE_PATH, help="arquivo do cache em disco")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    args = parser.parse_args()
+
+    try:
+        respostas = votacoes_plenario_periodo(_parse_data(args.inicio), _parse_data(args.fim), args.workers, args.cache)
+        com_votacao = sum(
+            1 for dia, r in respostas.items()
+            if r and senado_client.extrair_registros(r, f"plenario/lista/votacao/{dia:%Y%m%d}")
+        )
+        print(f"✅ {len(respostas)} dias consultados, {com_votacao} com votações")
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Busca interrompida. Os dias já concluídos ficam no cache.")
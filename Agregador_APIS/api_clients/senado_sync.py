@@ -0,0 +1,197 @@
+# senado_sync.py - Sincronização incremental das matérias do Senado em SQLite
+
+# Usa `listar_materias_atualizadas` como feed de mudanças: cada execução pede apenas
+# os dias desde a última sincronização, descarta as entradas do feed que não mudaram
+# desde a execução anterior e busca o detalhe só das matérias que se moveram, em
+# paralelo. O detalhe é gravado com upsert em um banco local indexado.
+#
+# Uso: python senado_sync.py [--db senado.sqlite3] [--dias 15] [--sigla PL] [--workers 4]
+
+import argparse
+import hashlib
+import json
+import math
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import senado_client
+
+DB_PATH = "senado.sqlite3"
+
+# Sem checkpoint, usa a mesma janela padrão de listar_materias_atualizadas
+DIAS_INICIAIS = 15
+MAX_WORKERS = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    endpoint TEXT PRIMARY KEY,
+    high_water TEXT NOT NULL,
+    atualizado_em TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS materias (
+    codigo INTEGER PRIMARY KEY,
+    sigla TEXT,
+    numero TEXT,
+    ano INTEGER,
+    ementa TEXT,
+    hash_feed TEXT,
+    sincronizado_em TEXT NOT NULL,
+    dados TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_materias_sigla_ano ON materias(sigla, ano);
+CREATE INDEX IF NOT EXISTS idx_materias_sincronizado_em ON materias(sincronizado_em);
+"""
+
+
+def conectar(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """Abre o banco local e garante o esquema."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def ler_checkpoint(conn: sqlite3.Connection, endpoint: str) -> Optional[str]:
+    row = conn.execute("SELECT high_water FROM checkpoints WHERE endpoint = ?", (endpoint,)).fetchone()
+    return row[0] if row else None
+
+
+def gravar_checkpoint(conn: sqlite3.Connection, endpoint: str, high_water: str) -> None:
+    conn.execute(
+        """INSERT INTO checkpoints (endpoint, high_water, atualizado_em) VALUES (?, ?, ?)
+           ON CONFLICT(endpoint) DO UPDATE SET high_water = excluded.high_water,
+                                               atualizado_em = excluded.atualizado_em""",
+        (endpoint, high_water, datetime.now().isoformat(timespec="seconds")),
+    )
+
+
+def _buscar_chave(obj: Any, chave: str) -> Any:
+    """Primeiro valor de `chave` em qualquer nível do objeto (busca iterativa)."""
+    pilha = [obj]
+    while pilha:
+        node = pilha.pop()
+        if isinstance(node, dict):
+            if chave in node:
+                return node[chave]
+            pilha.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            pilha.extend(reversed(node))
+    return None
+
+
+def _hash(registro: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(registro, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _numdias(ultima_sync: Optional[str], agora: datetime) -> int:
+    """Dias que o feed precisa cobrir desde a última sincronização (pelo menos 1)."""
+    if ultima_sync is None:
+        return DIAS_INICIAIS
+    decorrido = (agora - datetime.fromisoformat(ultima_sync)).total_seconds()
+    return max(1, math.ceil(decorrido / 86400))
+
+
+def _upsert_materia(conn: sqlite3.Connection, codigo: int, hash_feed: str, detalhe: Dict[str, Any], agora: str) -> None:
+    ano = _buscar_chave(detalhe, "AnoMateria")
+    conn.execute(
+        """INSERT INTO materias (codigo, sigla, numero, ano, ementa, hash_feed, sincronizado_em, dados)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+           ON CONFLICT(codigo) DO UPDATE SET sigla = excluded.sigla, numero = excluded.numero,
+                                             ano = excluded.ano, ementa = excluded.ementa,
+                                             hash_feed = excluded.hash_feed,
+                                             sincronizado_em = excluded.sincronizado_em,
+                                             dados = excluded.dados""",
+        (
+            codigo,
+            _buscar_chave(detalhe, "SiglaSubtipoMateria"),
+            _buscar_chave(detalhe, "NumeroMateria"),
+            int(ano) if ano and str(ano).isdigit() else None,
+            _buscar_chave(detalhe, "EmentaMateria"),
+            hash_feed,
+            agora,
+            json.dumps(detalhe, ensure_ascii=False),
+        ),
+    )
+
+
+def sincronizar(
+    db_path: str = DB_PATH,
+    dias: Optional[int] = None,
+    sigla: Optional[str] = None,
+    max_workers: int = MAX_WORKERS,
+) -> Tuple[int, int]:
+    """
+    Sincroniza as matérias alteradas desde o último checkpoint (ou nos últimos `dias`).
+    Retorna (entradas no feed, matérias atualizadas).
+    """
+    conn = conectar(db_path)
+    try:
+        endpoint = f"materia/atualizadas:{sigla or '*'}"
+        agora = datetime.now()
+        numdias = dias or _numdias(ler_checkpoint(conn, endpoint), agora)
+        print(f"🔄 Buscando matérias alteradas nos últimos {numdias} dia(s)...")
+
+        feed = senado_client.extrair_registros(
+            senado_client.listar_materias_atualizadas(numdias, sigla=sigla), "materia/atualizadas"
+        )
+        hashes_feed: Dict[int, str] = {}
+        for registro in feed:
+            codigo = _buscar_chave(registro, "CodigoMateria") or _buscar_chave(registro, "Codigo")
+            if codigo and str(codigo).isdigit():
+                hashes_feed[int(codigo)] = _hash(registro)
+
+        # O feed cobre dias inteiros: entradas iguais às da execução anterior já estão em dia
+        conhecidos = dict(conn.execute("SELECT codigo, hash_feed FROM materias"))
+        alterados: List[int] = [c for c, h in hashes_feed.items() if conhecidos.get(c) != h]
+        print(f"   📄 {len(hashes_feed)} matérias no feed, {len(alterados)} com mudanças")
+
+        atualizadas = falhas = 0
+        sincronizado_em = agora.isoformat(timespec="seconds")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futuros = [executor.submit(senado_client.obter_materia_por_codigo, c) for c in alterados]
+            # As buscas correm em paralelo; as escritas ficam nesta thread (sqlite)
+            for codigo, futuro in zip(alterados, futuros):
+                try:
+                    detalhe = futuro.result()
+                except senado_client.SenadoAPIError as e:
+                    falhas += 1
+                    print(f"   ⚠️ Matéria {codigo}: {e}")
+                    continue
+                _upsert_materia(conn, codigo, hashes_feed[codigo], detalhe, sincronizado_em)
+                atualizadas += 1
+
+        # Com falhas, o checkpoint não avança: a próxima execução cobre a mesma janela
+        if not falhas:
+            gravar_checkpoint(conn, endpoint, sincronizado_em)
+        conn.commit()
+        print(f"✅ {atualizadas} matérias atualizadas"
+              + (f" ({falhas} falhas, checkpoint mantido)" if falhas else f". Checkpoint: {sincronizado_em}"))
+        return len(hashes_feed), atualizadas
+    finally:
+        conn.close()
+
+
+def obter_materia_local(codigo: int, db_path: str = DB_PATH) -> Optional[Dict[str, Any]]:
+    """Detalhe da matéria gravado na última sincronização."""
+    conn = conectar(db_path)
+    try:
+        row = conn.execute("SELECT dados FROM materias WHERE codigo = ?", (codigo,)).fetchone()
+        return json.loads(row[0]) if row else None
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sincronização incremental das matérias do Senado em SQLite")
+    parser.add_argument("--db", default=DB_PATH, help="arquivo SQLite de destino")
+    parser.add_argument("--dias", type=int, help="força a janela do feed em dias")
+    parser.add_argument("--sigla", help="restringe a um tipo de matéria (ex.: PL)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    args = parser.parse_args()
+
+    try:
+        sincronizar(args.db, dias=args.dias, sigla=args.sigla, max_workers=args.workers)
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Sincronização interrompida. Nada foi gravado nesta execução.")
@@ -0,0 +1,213 @@
+# senado_votos.py - Histórico de votos dos senadores em tabela colunar (Parquet/Arrow)
+#
+# Busca `votos_senador` de cada senador em exercício, ano a ano, em paralelo. Todas
+# as threads dividem o limite de requisições do senado_client. Os votos aninhados
+# são achatados em colunas tipadas (senador, matéria, sessão, data, voto) e gravados
+# em uma partição por ano (<dir>/ano=AAAA/votos.parquet). Ao lado de cada partição,
+# `_gravado_em` registra quando ela foi gravada: um ano só deixa de ser buscado depois
+# de gravado com o ano já encerrado (o ano corrente é sempre atualizado).
+#
+# Uso: python senado_votos.py 2019 [--ate 2024] [--dir votos_senado] [--formato arrow] [--workers 4]
+#
+# Requer pyarrow.
+
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import senado_client
+
+DIRETORIO = "votos_senado"
+MAX_WORKERS = 4
+FORMATOS = {"parquet": "votos.parquet", "arrow": "votos.arrow"}
+# Data (ISO) da gravação da partição; o prefixo "_" a deixa fora da leitura das partições
+GRAVADO_EM = "_gravado_em"
+
+
+def _schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("codigo_senador", pa.int32()),
+        ("nome_senador", pa.string()),
+        ("partido", pa.dictionary(pa.int16(), pa.string())),
+        ("uf", pa.dictionary(pa.int8(), pa.string())),
+        ("codigo_materia", pa.int64()),
+        ("sigla_materia", pa.dictionary(pa.int16(), pa.string())),
+        ("numero_materia", pa.string()),
+        ("ano_materia", pa.int16()),
+        ("codigo_sessao", pa.int64()),
+        ("codigo_votacao", pa.int64()),
+        ("data", pa.date32()),
+        ("voto", pa.dictionary(pa.int8(), pa.string())),
+        ("descricao_votacao", pa.string()),
+    ])
+
+
+def _int(valor: Any) -> Optional[int]:
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return None
+
+
+def _data(valor: Any) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(valor)[:10])
+    except ValueError:
+        return None
+
+
+def senadores_em_exercicio() -> List[Dict[str, Any]]:
+    """Código, nome, partido e UF dos senadores em exercício."""
+    resposta = senado_client.listar_senadores_em_exercicio()
+    senadores = []
+    for parlamentar in senado_client.extrair_registros(resposta, "senador/lista/atual"):
+        ident = parlamentar.get("IdentificacaoParlamentar", parlamentar)
+        codigo = _int(ident.get("CodigoParlamentar"))
+        if codigo is not None:
+            senadores.append({
+                "codigo": codigo,
+                "nome": ident.get("NomeParlamentar"),
+                "partido": ident.get("SiglaPartidoParlamentar"),
+                "uf": ident.get("UfParlamentar"),
+            })
+    return senadores
+
+
+def _achatar_voto(senador: Dict[str, Any], votacao: Dict[str, Any]) -> Tuple:
+    sessao = votacao.get("SessaoPlenaria") or {}
+    materia = votacao.get("IdentificacaoMateria") or votacao.get("Materia") or {}
+    return (
+        senador["codigo"],
+        senador["nome"],
+        senador["partido"],
+        senador["uf"],
+        _int(materia.get("CodigoMateria")),
+        materia.get("SiglaSubtipoMateria"),
+        materia.get("NumeroMateria"),
+        _int(materia.get("AnoMateria")),
+        _int(sessao.get("CodigoSessao")),
+        _int(votacao.get("CodigoSessaoVotacao")),
+        _data(sessao.get("DataSessao") or votacao.get("DataSessao")),
+        votacao.get("SiglaDescricaoVoto") or votacao.get("DescricaoVoto"),
+        votacao.get("DescricaoVotacao"),
+    )
+
+
+def votos_do_ano(senador: Dict[str, Any], ano: int) -> List[Tuple]:
+    """Votos de um senador em um ano, já achatados na ordem das colunas do schema."""
+    codigo = senador["codigo"]
+    resposta = senado_client.votos_senador(codigo, ano=ano)
+    return [_achatar_voto(senador, v) for v in senado_client.extrair_registros(resposta, f"senador/{codigo}/votacoes")]
+
+
+def _caminho(diretorio: str, ano: int, formato: str) -> str:
+    return os.path.join(diretorio, f"ano={ano}", FORMATOS[formato])
+
+
+def _fechado(diretorio: str, ano: int, formato: str) -> bool:
+    """Verdadeiro se a partição do ano existe e foi gravada depois de o ano terminar."""
+    if not os.path.exists(_caminho(diretorio, ano, formato)):
+        return False
+    try:
+        with open(os.path.join(diretorio, f"ano={ano}", GRAVADO_EM)) as f:
+            gravado_em = f.read().strip()
+    except OSError:
+        return False  # partição sem registro (ex.: gravada por versão anterior): refaz
+    return gravado_em >= date(ano + 1, 1, 1).isoformat()
+
+
+def _gravar(linhas: List[Tuple], caminho: str, formato: str) -> None:
+    import pyarrow as pa
+
+    schema = _schema()
+    colunas = list(zip(*linhas)) if linhas else [[] for _ in schema]
+    tabela = pa.table([pa.array(col, type=campo.type) for col, campo in zip(colunas, schema)], schema=schema)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    # Prefixo "_": arquivos temporários são ignorados pela leitura das partições
+    temporario = os.path.join(os.path.dirname(caminho), "_" + os.path.basename(caminho) + ".part")
+    if formato == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(tabela, temporario)
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(tabela, temporario)
+    # Troca atômica: uma carga interrompida não deixa partição pela metade
+    os.replace(temporario, caminho)
+    with open(os.path.join(os.path.dirname(caminho), GRAVADO_EM), "w") as f:
+        f.write(date.today().isoformat())
+
+
+def carregar_votos(
+    anos: Iterable[int],
+    diretorio: str = DIRETORIO,
+    formato: str = "parquet",
+    max_workers: int = MAX_WORKERS,
+) -> Dict[int, int]:
+    """
+    Grava uma partição por ano com os votos de todos os senadores em exercício.
+    Anos cuja partição foi gravada depois de encerrados são pulados; os demais
+    (incluindo o corrente e os gravados enquanto ainda estavam em curso) são refeitos.
+    Retorna {ano: votos gravados} dos anos buscados nesta execução.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"formato deve ser um de {sorted(FORMATOS)}")
+    pendentes = [ano for ano in dict.fromkeys(anos) if not _fechado(diretorio, ano, formato)]
+    if not pendentes:
+        print("✅ Todos os anos já estão gravados")
+        return {}
+
+    senadores = senadores_em_exercicio()
+    print(f"🗳️ {len(senadores)} senadores × {len(pendentes)} ano(s): {pendentes}")
+
+    tarefas = [(s, ano) for ano in pendentes for s in senadores]
+    linhas_por_ano: Dict[int, List[Tuple]] = {ano: [] for ano in pendentes}
+    falhas: Dict[int, int] = {ano: 0 for ano in pendentes}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futuros = [executor.submit(votos_do_ano, s, ano) for s, ano in tarefas]
+        for (senador, ano), futuro in zip(tarefas, futuros):
+            try:
+                linhas_por_ano[ano].extend(futuro.result())
+            except senado_client.SenadoAPIError as e:
+                falhas[ano] += 1
+                print(f"   ⚠️ Senador {senador['codigo']} em {ano}: {e}")
+
+    gravados: Dict[int, int] = {}
+    for ano, linhas in linhas_por_ano.items():
+        if falhas[ano]:
+            # Partição incompleta não é gravada: o ano volta a ser buscado na próxima execução
+            print(f"   ⏭️ {ano}: {falhas[ano]} falhas, partição não gravada")
+            continue
+        _gravar(linhas, _caminho(diretorio, ano, formato), formato)
+        gravados[ano] = len(linhas)
+        print(f"   💾 {ano}: {len(linhas)} votos")
+    return gravados
+
+
+def ler_votos(diretorio: str = DIRETORIO, formato: str = "parquet"):
+    """Lê todas as partições como uma única tabela pyarrow (com a coluna `ano`)."""
+    import pyarrow.dataset as ds
+
+    return ds.dataset(
+        diretorio,
+        format="parquet" if formato == "parquet" else "ipc",
+        partitioning="hive",
+    ).to_table()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Histórico de votos dos senadores em Parquet/Arrow")
+    parser.add_argument("desde", type=int, help="primeiro ano")
+    parser.add_argument("--ate", type=int, default=date.today().year, help="último ano (padrão: ano corrente)")
+    parser.add_argument("--dir", default=DIRETORIO, help="diretório de saída")
+    parser.add_argument("--formato", choices=sorted(FORMATOS), default="parquet")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    args = parser.parse_args()
+
+    try:
+        carregar_votos(range(args.desde, args.ate + 1), args.dir, args.formato, args.workers)
+    except KeyboardInterrupt:
+        print("\n\n⏹️  Carga interrompida. Anos encerrados já gravados não serão buscados de novo.")
@@ -0,0 +1,58 @@
+# single_flight.py - Coalescência de requisições idênticas simultâneas
+
+# Quando várias threads pedem o mesmo recurso ao mesmo tempo, só a primeira faz a
+# requisição; as demais esperam e recebem o mesmo resultado (ou a mesma exceção).
+
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """De-duplica chamadas em andamento com a mesma chave."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Executa `fn` uma única vez por chave em andamento. O resultado é
+        compartilhado entre os chamadores e não deve ser modificado por eles.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None, *extra: Hashable) -> Hashable:
+    """Chave estável para URL + parâmetros (independente da ordem dos parâmetros)."""
+    return (url, json.dumps(params or {}, sort_keys=True, default=str), *extra)
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import requests
 from dotenv import load_dotenv
 
+from json_codec import decode_response
+
 load_dotenv()
 
 BASE_URL = "https://api.portaldatransparencia.gov.br"
@@ -100,7 +102,7 @@ class PortalTransparenciaClient:
                     return None
                 ct = resp.headers.get("Content-Type", "")
                 if "json" in ct:
-                    return resp.json()
+                    return decode_response(resp)
                 return resp.text
             except requests.RequestException as e:
                 last_err = e
@@ -148,7 +150,7 @@ class PortalTransparenciaClient:
                 try:
                     r = self.session.get(url, timeout=self.timeout)
                     r.raise_for_status()
-                    self._openapi = r.json()
+                    self._openapi = decode_response(r)
                     break
                 except requests.RequestException:
                     time.sleep(self.backoff_base ** attempt)
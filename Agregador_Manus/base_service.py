@@ -5,6 +5,7 @@ from datetime import datetime
 import structlog
 from app.models.search import SearchResult
 from app.core.cache import CacheService
+from app.core.json_codec import decode_response
 
 logger = structlog.get_logger()
 
@@ -108,7 +109,7 @@ class BaseAPIService:
             
             # Verifica se a resposta foi bem-sucedida
             if response.status_code == 200:
-                return response.json()
+                return decode_response(response)
             elif response.status_code == 429:
                 logger.warning("API rate limit hit", service=self.name)
                 return None
@@ -5,6 +5,7 @@ from typing import Any, Optional, Dict
 from datetime import datetime, timedelta
 import structlog
 from app.config import settings
+from app.core import json_codec
 
 logger = structlog.get_logger()
 
@@ -58,7 +59,7 @@ class CacheService:
         try:
             data = await self.redis.get(key)
             if data:
-                result = json.loads(data)
+                result = json_codec.loads(data)
                 logger.debug("Cache hit", key=key)
                 return result
             else:
@@ -80,7 +81,8 @@ class CacheService:
         
         try:
             ttl = ttl or settings.cache_ttl
-            data = json.dumps(value, default=str)
+            # Sem escape de não-ASCII: o Redis guarda UTF-8 e o valor decodificado é o mesmo
+            data = json_codec.dumps(value, default=str, ensure_ascii=False)
             
             await self.redis.setex(key, ttl, data)
             logger.debug("Cache set", key=key, ttl=ttl)
@@ -0,0 +1,60 @@
+# json_codec.py - Codificação/decodificação JSON com motor plugável (orjson opcional)
+#
+# Cópia de Agregador_APIS/api_clients/json_codec.py, que é a versão de referência
+# (documentação, benchmark). Os dois apps são implantados separadamente e não
+# compartilham código; mudanças devem ser feitas lá e replicadas aqui.
+
+import json
+import os
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # motor rápido opcional
+    orjson = None
+
+if os.environ.get("JSON_CODEC", "").lower() == "json":
+    orjson = None
+
+ENGINE = "orjson" if orjson is not None else "json"
+
+if orjson is not None:
+    # Datas e dataclasses vão para `default`, como no json padrão (orjson as serializaria sozinho)
+    _OPCOES_ORJSON = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decodifica JSON (bytes UTF-8 ou str)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # a biblioteca padrão decide (e gera o erro, se for inválido)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, ensure_ascii: bool = True) -> str:
+    """Codifica em JSON (str); o orjson só é usado com `ensure_ascii=False`."""
+    if orjson is not None and not ensure_ascii:
+        try:
+            return orjson.dumps(obj, default=default, option=_OPCOES_ORJSON).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # ex.: inteiro acima de 64 bits
+    return json.dumps(obj, default=default, ensure_ascii=ensure_ascii)
+
+
+def decode_response(response: Any) -> Any:
+    """
+    Corpo JSON de uma resposta httpx/requests, equivalente a `response.json()`.
+    O motor rápido só lê os bytes direto quando o encoding é UTF-8.
+    """
+    if orjson is not None:
+        encoding = (getattr(response, "encoding", None) or "utf-8").lower().replace("_", "-")
+        if encoding in ("utf-8", "utf8"):
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+    return response.json()